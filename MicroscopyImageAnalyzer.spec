@@ -1,38 +1,85 @@
 # -*- mode: python ; coding: utf-8 -*-
+# Canonical PyInstaller spec for Microscopy Image Analyzer.
+# Build with: python build.py  (or: pyinstaller --noconfirm MicroscopyImageAnalyzer.spec)
 
+import os
+from PyInstaller.compat import is_win
+
+# `python build.py --dev` sets this for an extraction-free onedir build;
+# release builds stay onefile.
+ONEDIR = os.environ.get('MIA_BUILD_ONEDIR') == '1'
 
 a = Analysis(
     ['main.py'],
-    pathex=[],
+    # src/ and config/ are found through their imports and go into the PYZ
+    pathex=[SPECPATH],
     binaries=[],
-    datas=[('config', 'config'), ('src', 'src')],
-    hiddenimports=['tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox', 'PIL._tkinter_finder'],
+    datas=[],
+    hiddenimports=['PIL._tkinter_finder'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'matplotlib', 'scipy', 'pytest',
+        'tkinter.test', 'tkinter.dnd',
+        'PIL.ImageQt', 'PIL.ImageCms',
+        'numpy.distutils', 'numpy.testing', 'numpy.f2py',
+        'setuptools', 'pip', 'pkg_resources',
+        'pydoc', 'pydoc_data', 'lib2to3', 'unittest', 'test', 'xmlrpc',
+    ],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='MicroscopyImageAnalyzer',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+# UPX-compressing the CPython/VC runtime DLLs breaks their signatures
+upx_exclude = ['vcruntime140.dll', 'VCRUNTIME140.dll', 'python3*.dll']
+
+if ONEDIR:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='MicroscopyImageAnalyzer',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=not is_win,
+        upx=True,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=not is_win,
+        upx=True,
+        upx_exclude=upx_exclude,
+        name='MicroscopyImageAnalyzer',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='MicroscopyImageAnalyzer',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=not is_win,
+        upx=True,
+        upx_exclude=upx_exclude,
+        runtime_tmpdir=None,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
@@ -6,16 +6,67 @@ Author: Muhammad Sinan
 Institution: Polish Academy of Sciences
 Version: 0.2.20.07.2
 
-USAGE: python build.py
+USAGE: python build.py [--full] [--dev]
+
+The build is driven by MicroscopyImageAnalyzer.spec. The build/ folder is
+kept between runs so PyInstaller can reuse its analysis cache; pass --full
+to wipe it and rebuild from scratch. --dev produces an onedir build that
+starts without unpacking to a temp folder, for quicker test launches.
 """
 
 import subprocess
 import sys
 import os
-import shutil
 import time
 from pathlib import Path
-from datetime import datetime
+
+PROJECT_DIR = Path(__file__).resolve().parent
+SPEC_FILE = "MicroscopyImageAnalyzer.spec"
+# (distribution name, top-level module) pairs needed for the build
+BUILD_DEPENDENCIES = (
+    ("pillow", "PIL"),
+    ("numpy", "numpy"),
+    ("imageio", "imageio"),
+    ("imageio-ffmpeg", "imageio_ffmpeg"),
+    ("pyinstaller", "PyInstaller"),
+)
+WHEEL_DIR = Path("wheels")
+PIP_OPTIONS = [
+    "--prefer-binary",
+    "--cache-dir", str(Path.home() / ".cache" / "pip"),
+    "--find-links", str(WHEEL_DIR),
+]
+
+def _unlink_with_retry(path):
+    """Unlink a file, retrying briefly while it is locked"""
+    for attempt in range(3):
+        try:
+            os.unlink(path)
+            return
+        except PermissionError:
+            if attempt == 2:
+                raise
+            time.sleep(0.1)
+
+def fast_rmtree(path):
+    """Remove a directory tree, unlinking files from a thread pool"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    files, dirs = [], []
+    for root, dirnames, filenames in os.walk(path, topdown=False):
+        files.extend(os.path.join(root, name) for name in filenames)
+        # Symlinked directories are not walked into, just unlinked
+        files.extend(os.path.join(root, name) for name in dirnames
+                     if os.path.islink(os.path.join(root, name)))
+        dirs.append(root)
+    
+    # Unlinking is syscall-bound, so threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(_unlink_with_retry, files))
+    
+    # os.walk(topdown=False) yields children before their parents
+    for directory in dirs:
+        os.rmdir(directory)
 
 def safe_remove_dir(path):
     """Safely remove directory with retries"""
@@ -24,7 +75,7 @@ def safe_remove_dir(path):
     
     for attempt in range(3):
         try:
-            shutil.rmtree(path)
+            fast_rmtree(path)
             print(f"✅ Cleaned {path}")
             return True
         except PermissionError:
@@ -38,71 +89,110 @@ def safe_remove_dir(path):
             print(f"⚠️ Error cleaning {path}: {e}")
             return False
 
-def main():
+def ensure_dependencies():
+    """Install any missing build dependencies with a single pip call"""
+    from importlib.util import find_spec
+    
+    # find_spec only locates the modules; nothing is imported or executed
+    missing = [dist for dist, module in BUILD_DEPENDENCIES if find_spec(module) is None]
+    
+    if not missing:
+        print("✅ All dependencies found")
+        return
+    
+    print(f"❌ Installing {', '.join(missing)}...")
+    build_wheelhouse()
+    subprocess.run([
+        sys.executable, "-m", "pip", "install", *PIP_OPTIONS,
+        "--upgrade-strategy=only-if-needed",
+        "-r", "requirements.txt", "wheel", "pyinstaller"
+    ], check=True)
+    print("✅ Dependencies installed")
+
+def build_wheelhouse():
+    """Cache wheels for the requirements locally, once per requirements change"""
+    requirements = Path("requirements.txt").read_text()
+    stamp = WHEEL_DIR / ".stamp"
+    if stamp.exists() and stamp.read_text() == requirements:
+        return
+    
+    WHEEL_DIR.mkdir(exist_ok=True)
+    subprocess.run([
+        sys.executable, "-m", "pip", "wheel", *PIP_OPTIONS,
+        "-w", str(WHEEL_DIR),
+        "-r", "requirements.txt", "pyinstaller"
+    ], check=True)
+    stamp.write_text(requirements)
+
+def run_streamed(cmd, env=None, log_path=None):
+    """Run a command, echoing its output line by line as it arrives.
+    
+    If log_path is given the output is also written there, so a failed
+    build can be inspected after the terminal has scrolled away.
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, errors="replace", bufsize=1, env=env
+    )
+    if log_path is None:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        return proc.wait()
+    
+    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as log:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            log.write(line)
+    return proc.wait()
+
+def main(full=False, dev=False):
     """Simple build process"""
     
     print("🔬 MICROSCOPY IMAGE ANALYZER - SIMPLE BUILD")
-    print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"📅 {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"👨‍🔬 Author: Muhammad Sinan")
     print("="*50)
     
     # Change to project directory
-    project_dir = Path(__file__).parent
-    os.chdir(project_dir)
+    os.chdir(PROJECT_DIR)
     
-    # Clean previous builds (skip if locked)
+    # Clean previous builds (skip if locked). build/ holds PyInstaller's
+    # analysis cache, so it is only wiped on a full rebuild.
     print("🧹 Cleaning previous builds...")
-    safe_remove_dir("build")
+    if full:
+        safe_remove_dir("build")
     safe_remove_dir("dist")
     
-    # Remove spec files
-    for spec_file in project_dir.glob("*.spec"):
-        try:
-            spec_file.unlink()
-            print(f"✅ Removed {spec_file.name}")
-        except:
-            pass
-    
-    # Check PyInstaller
-    print("\n📦 Checking PyInstaller...")
-    try:
-        subprocess.run([sys.executable, "-m", "pip", "show", "pyinstaller"], 
-                     check=True, capture_output=True)
-        print("✅ PyInstaller found")
-    except subprocess.CalledProcessError:
-        print("❌ Installing PyInstaller...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
-        print("✅ PyInstaller installed")
+    # Check dependencies
+    print("\n📦 Checking dependencies...")
+    ensure_dependencies()
     
     # Build executable
     print("\n🔨 Building executable...")
     
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--name=MicroscopyImageAnalyzer",
-        "--onefile",
-        "--windowed", 
         "--noconfirm",
-        "--add-data=config;config",
-        "--add-data=src;src",
-        "--hidden-import=tkinter",
-        "--hidden-import=tkinter.ttk",
-        "--hidden-import=tkinter.filedialog", 
-        "--hidden-import=tkinter.messagebox",
-        "--hidden-import=PIL._tkinter_finder",
-        "main.py"
+        "--workpath", "build",
+        "--distpath", "dist",
     ]
+    if full:
+        cmd.append("--clean")
+    cmd.append(SPEC_FILE)
+    env = dict(os.environ, MIA_BUILD_ONEDIR="1" if dev else "0")
     
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("✅ Build completed!")
-    except subprocess.CalledProcessError as e:
-        print("❌ Build failed!")
-        print(f"Error: {e.stderr}")
+    log_path = PROJECT_DIR / "build" / "build.log"
+    if run_streamed(cmd, env=env, log_path=log_path) != 0:
+        print(f"❌ Build failed! Full log: {log_path}")
         return False
+    print("✅ Build completed!")
     
     # Check result
-    exe_path = project_dir / "dist" / "MicroscopyImageAnalyzer.exe"
+    dist_dir = PROJECT_DIR / "dist"
+    if dev:
+        dist_dir = dist_dir / "MicroscopyImageAnalyzer"
+    exe_path = dist_dir / "MicroscopyImageAnalyzer.exe"
     if exe_path.exists():
         size_mb = exe_path.stat().st_size / 1024 / 1024
         print(f"\n🎉 SUCCESS!")
@@ -117,7 +207,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        success = main()
+        success = main(full="--full" in sys.argv[1:], dev="--dev" in sys.argv[1:])
         if not success:
             print("\n❌ Build failed!")
     except KeyboardInterrupt:
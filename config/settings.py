@@ -3,8 +3,21 @@ Configuration settings for the Microscopy Image Analyzer
 """
 
 import os
+import re
+import fnmatch
 
-class AppConfig:
+
+class _FrozenConfig(type):
+    """Metaclass that makes configuration classes read-only"""
+    
+    def __setattr__(cls, name, value):
+        raise AttributeError(f"{cls.__name__}.{name} is read-only")
+    
+    def __delattr__(cls, name):
+        raise AttributeError(f"{cls.__name__}.{name} is read-only")
+
+
+class AppConfig(metaclass=_FrozenConfig):
     """Application configuration settings"""
     
     # Application settings
@@ -16,13 +29,29 @@ class AppConfig:
     WINDOW_HEIGHT = 850
     CANVAS_WIDTH = 800
     CANVAS_HEIGHT = 600
+    REDRAW_DELAY_MS = 16  # Coalesce pan/zoom redraws to roughly one per frame
+    PIL_BLOCKS_MAX = 4  # Freed Pillow memory blocks (16 MB each) kept for reuse
+    RENDER_POLL_MS = 10  # How often to check for a finished background resize
+    SETTLE_DELAY_MS = 150  # Quiet time after wheel zooming before a full-quality redraw
+    COORD_UPDATE_INTERVAL = 1 / 30  # Seconds between pointer coordinate label updates
+    PREVIEW_DELAY_MS = 150  # Typing/slider pause before an export dialog refreshes its preview
     
     # Image processing settings
     SUPPORTED_FORMATS = ('*.jpg', '*.jpeg', '*.png', '*.tif', '*.tiff', '*.bmp', '*.gif')
+    _SUPPORTED_PATTERN = re.compile(
+        '|'.join(fnmatch.translate(pattern) for pattern in SUPPORTED_FORMATS),
+        re.IGNORECASE
+    )
     MAX_ZOOM = 20.0
     MIN_ZOOM = 0.1
     ZOOM_FACTOR = 1.2
+    NEAREST_ZOOM = 4.0  # Zoom from which redraws during wheel zooming use nearest-neighbour
     MAX_IMAGE_SIZE = 4000  # Maximum displayed image dimension
+    IMAGE_CACHE_SIZE = 8  # Decoded images kept for fast previous/next navigation
+    RESIZE_CACHE_SIZE = 4  # Resized views of the current image kept for zooming back
+    PHOTO_POOL_SIZE = 3  # Tk photo images kept per display size for reuse
+    SAVE_WORKERS = 8  # Threads used to write exported images
+    PNG_COMPRESS_LEVEL = 1  # zlib level for exported PNGs (fast; files slightly larger)
     
     # ROI settings
     ROI_COLOR = "#4a6ea9"
@@ -34,6 +63,8 @@ class AppConfig:
     
     # GIF settings
     GIF_DURATION = 0.2  # seconds per frame
+    GIF_PALETTE_SAMPLES = 8  # Frames used to build the shared GIF palette
+    VIDEO_MAX_DIMENSION = 1920  # Longer video side in pixels; larger crops are scaled down (1080p)
     
     # UI Theme
     UI_THEME = 'clam'
@@ -42,6 +73,11 @@ class AppConfig:
     DEFAULT_IMPORT_FOLDER = "import"
     DEFAULT_EXPORT_FOLDER = "export"
     
+    @classmethod
+    def is_supported(cls, filename):
+        """Check if a file name matches one of the supported formats"""
+        return cls._SUPPORTED_PATTERN.match(filename) is not None
+    
     @classmethod
     def get_default_folders(cls, base_path):
         """Get default import/export folder paths"""
@@ -50,7 +86,7 @@ class AppConfig:
             'export': os.path.join(base_path, cls.DEFAULT_EXPORT_FOLDER)
         }
 
-class UIConfig:
+class UIConfig(metaclass=_FrozenConfig):
     """UI-specific configuration"""
     
     # Colors
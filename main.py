@@ -1,5 +1,9 @@
 """
-Setup script for building executable - fixes import paths
+Entry point for running from source and for the packaged executable.
+
+The script directory is already sys.path[0] when run as ``python main.py``
+and the frozen build finds src/ and config/ in its bundled archive, so no
+import path setup is needed here.
 
 Author: Muhammad Sinan
 Institution: Polish Academy of Sciences
@@ -7,18 +11,20 @@ Contact: https://www.ippt.pan.pl/en/staff/?osoba=msinan
 Version: 2.0.0
 """
 
-import sys
 import os
-
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import sys
 
 # Import and run the main application
 if __name__ == "__main__":
     try:
-        from src.app import main
+        from config.settings import AppConfig
+        
+        # Let Pillow keep freed memory blocks for reuse, so the same-sized buffers
+        # allocated on every redraw are recycled. Pillow reads this when PIL.Image
+        # is first imported, so it is set before the application is loaded
+        os.environ.setdefault("PILLOW_BLOCKS_MAX", str(AppConfig.PIL_BLOCKS_MAX))
+        
+        from src import main
         main()
     except Exception as e:
         import tkinter as tk
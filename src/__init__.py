@@ -15,6 +15,19 @@ Contact: https://www.ippt.pan.pl/en/staff/?osoba=msinan
 __version__ = "2.0.0"
 __author__ = "Muhammad Sinan"
 
-from .app import MicroscopyImageAnalyzer, main
-
 __all__ = ["MicroscopyImageAnalyzer", "main"]
+
+
+def __getattr__(name):
+    """Import the application lazily so that `import src` stays cheap"""
+    if name in __all__:
+        from . import app
+        value = getattr(app, name)
+        globals()[name] = value  # later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported names in dir(src)"""
+    return sorted(set(globals()) | set(__all__))
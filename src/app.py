@@ -14,7 +14,12 @@ Version: 2.0.0
 import tkinter as tk
 from tkinter import messagebox
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
+from PIL import Image, ImageTk
 
 from src.gui.main_window import MainWindow
 from src.core.image_processor import ImageProcessor
@@ -26,6 +31,35 @@ from config.settings import AppConfig
 class MicroscopyImageAnalyzer:
     """Main application controller"""
     
+    # (window attribute, callback attribute, handler) triples wired up by _connect_callbacks
+    _WIRING = (
+        # Path controls
+        ("path_controls", "on_input_folder_changed", "_on_input_folder_changed"),
+        ("path_controls", "on_export_folder_changed", "_on_export_folder_changed"),
+        # Cell location controls
+        ("cell_controls", "on_locate_cell", "_on_locate_cell"),
+        ("cell_controls", "on_toggle_crosshair", "_on_toggle_crosshair"),
+        # ROI controls
+        ("roi_controls", "on_draw_roi", "_on_draw_roi"),
+        # Cropping controls
+        ("crop_controls", "on_crop_all", "_on_crop_all"),
+        ("crop_controls", "on_export", "_on_export"),
+        # Image canvas events
+        ("image_canvas", "on_mouse_motion", "_on_mouse_motion"),
+        ("image_canvas", "on_mouse_press", "_on_mouse_press"),
+        ("image_canvas", "on_mouse_drag", "_on_mouse_drag"),
+        ("image_canvas", "on_mouse_release", "_on_mouse_release"),
+        ("image_canvas", "on_mouse_wheel", "_on_mouse_wheel"),
+        ("image_canvas", "on_resize", "_on_canvas_resize"),
+        # Navigation controls
+        ("nav_controls", "on_previous", "_on_previous_image"),
+        ("nav_controls", "on_next", "_on_next_image"),
+        ("nav_controls", "on_zoom_in", "_on_zoom_in"),
+        ("nav_controls", "on_zoom_out", "_on_zoom_out"),
+        ("nav_controls", "on_reset_view", "_on_reset_view"),
+        ("nav_controls", "on_toggle_pan", "_on_toggle_pan"),
+    )
+    
     def __init__(self):
         # Initialize components
         self.window = MainWindow()
@@ -35,6 +69,43 @@ class MicroscopyImageAnalyzer:
         # State variables
         self.pan_mode = False
         self.pan_start = {"x": 0, "y": 0}
+        self._redraw_pending = False
+        self._wheel_pending = False
+        self._last_coord_t = 0.0
+        self._coord_pending = False
+        self._coord_pos = (0, 0)
+        self._wheel_steps = 0
+        self._wheel_focus = (0, 0)
+        
+        # While wheel zooming, render with a cheaper filter and refine once it settles
+        self._interacting = False
+        self._settle_job: Optional[str] = None
+        self._image_item: Optional[int] = None
+        self._photo: Optional[ImageTk.PhotoImage] = None
+        # PhotoImages by (size, mode), reused by pasting new pixels into them
+        self._photo_pool: "OrderedDict[tuple, ImageTk.PhotoImage]" = OrderedDict()
+        
+        # Display resizing runs on a worker thread. Each request carries a
+        # generation number so results for superseded requests are dropped.
+        self._render_jobs: "queue.Queue[tuple]" = queue.Queue()
+        self._render_results: "queue.Queue[tuple]" = queue.Queue()
+        self._render_gen = 0
+        self._render_job_gen = 0  # Generation of the last job handed to the worker
+        self._render_image: Optional[Image.Image] = None
+        self._render_size: Optional[tuple] = None
+        self._render_resample: Optional[int] = None
+        # Rendered part of the scaled image as (x0, y0, x1, y1); the whole
+        # image unless it is much larger than the canvas
+        self._render_window: Optional[tuple] = None
+        self._render_polling = False
+        # Recent resizes of the current image by (size, resample, window), so
+        # zooming or panning back doesn't resample again
+        self._resize_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        threading.Thread(target=self._render_worker, name="display-render", daemon=True).start()
+        
+        # Canvas size, kept up to date from <Configure> events
+        self._canvas_w = AppConfig.CANVAS_WIDTH
+        self._canvas_h = AppConfig.CANVAS_HEIGHT
         
         # Export folder persistence
         self.last_export_folder: Optional[str] = None
@@ -52,46 +123,16 @@ class MicroscopyImageAnalyzer:
     
     def _connect_callbacks(self) -> None:
         """Connect GUI callbacks to handler methods"""
-        # Path controls
-        if self.window.path_controls:
-            self.window.path_controls.on_input_folder_changed = self._on_input_folder_changed
-            self.window.path_controls.on_export_folder_changed = self._on_export_folder_changed
-        
-        # Cell location controls
-        if self.window.cell_controls:
-            self.window.cell_controls.on_locate_cell = self._on_locate_cell
-            self.window.cell_controls.on_toggle_crosshair = self._on_toggle_crosshair
-        
-        # ROI controls
-        if self.window.roi_controls:
-            self.window.roi_controls.on_draw_roi = self._on_draw_roi
-        
-        # Cropping controls
-        if self.window.crop_controls:
-            self.window.crop_controls.on_crop_all = self._on_crop_all
-            self.window.crop_controls.on_export = self._on_export
-        
-        # Image canvas events
-        if self.window.image_canvas:
-            self.window.image_canvas.on_mouse_motion = self._on_mouse_motion
-            self.window.image_canvas.on_mouse_press = self._on_mouse_press
-            self.window.image_canvas.on_mouse_drag = self._on_mouse_drag
-            self.window.image_canvas.on_mouse_release = self._on_mouse_release
-            self.window.image_canvas.on_mouse_wheel = self._on_mouse_wheel
-        
-        # Navigation controls
-        if self.window.nav_controls:
-            self.window.nav_controls.on_previous = self._on_previous_image
-            self.window.nav_controls.on_next = self._on_next_image
-            self.window.nav_controls.on_zoom_in = self._on_zoom_in
-            self.window.nav_controls.on_zoom_out = self._on_zoom_out
-            self.window.nav_controls.on_reset_view = self._on_reset_view
-            self.window.nav_controls.on_toggle_pan = self._on_toggle_pan
+        for widget_name, event, handler in self._WIRING:
+            widget = getattr(self.window, widget_name, None)
+            if widget is not None:
+                setattr(widget, event, getattr(self, handler))
         
         # Reset button
-        if hasattr(self.window, 'reset_button'):
-            self.window.reset_button.config(command=self._on_reset_everything)
-            
+        reset_button = getattr(self.window, 'reset_button', None)
+        if reset_button is not None:
+            reset_button.config(command=self._on_reset_everything)
+        
         # Set menu callbacks for File menu
         self.window.on_select_input_folder = self._on_select_input_folder_menu
         self.window.on_export = self._on_export
@@ -101,19 +142,19 @@ class MicroscopyImageAnalyzer:
         if self.image_processor.load_images_from_folder(folder_path):
             canvas = self.window.get_canvas()
             if canvas and self.image_processor.load_current_image(
-                canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
+                self._canvas_w,
+                self._canvas_h
             ):
                 info = self.image_processor.get_image_info()
-                self.window.update_status(
+                self._post_status(
                     f"Loaded {info['total_images']} images", "success"
                 )
                 self._update_image_display()
                 self._update_image_counter()
             else:
-                self.window.update_status("Failed to load images", "error")
+                self._post_status("Failed to load images", "error")
         else:
-            self.window.update_status("No images found in folder", "error")
+            self._post_status("No images found in folder", "error")
             messagebox.showwarning("No Images", "No images found in the selected folder.")
     
     def _on_select_input_folder_menu(self) -> None:
@@ -144,18 +185,22 @@ class MicroscopyImageAnalyzer:
         if canvas:
             self.image_processor.center_on_coordinates(
                 x, y, 
-                canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
+                self._canvas_w,
+                self._canvas_h
             )
             self._update_image_display()
     
     def _on_toggle_crosshair(self) -> None:
         """Handle crosshair toggle"""
         show_crosshair = self.image_processor.toggle_crosshair()
-        self._update_image_display()
+        
+        # Only the crosshair items change state; the image and ROI stay as they are
+        canvas = self.window.get_canvas()
+        if canvas:
+            self.image_processor.draw_crosshair(canvas, self._canvas_w, self._canvas_h)
         
         status = "shown" if show_crosshair else "hidden"
-        self.window.update_status(f"Crosshair {status}", "success")
+        self._post_status(f"Crosshair {status}", "success")
     
     def _on_draw_roi(self) -> None:
         """Handle ROI drawing request"""
@@ -236,9 +281,25 @@ class MicroscopyImageAnalyzer:
             messagebox.showerror("Error", "❌ Export failed. Please check your settings and try again.")
     
     def _on_mouse_motion(self, event: tk.Event) -> None:
-        """Handle mouse motion over canvas"""
-        if self.image_processor.original_image and self.window.image_canvas:
-            img_x, img_y = self.image_processor.screen_to_image_coords(event.x, event.y)
+        """Handle mouse motion over canvas, updating the coordinate label at most ~30 times/s"""
+        if not self.image_processor.original_image or not self.window.image_canvas:
+            return
+        
+        self._coord_pos = (event.x, event.y)
+        wait = AppConfig.COORD_UPDATE_INTERVAL - (time.monotonic() - self._last_coord_t)
+        if wait <= 0:
+            self._flush_coordinates()
+        elif not self._coord_pending:
+            # Make sure the label catches up with where the pointer stopped
+            self._coord_pending = True
+            self.window.get_canvas().after(int(wait * 1000) + 1, self._flush_coordinates)
+    
+    def _flush_coordinates(self) -> None:
+        """Show the image coordinates of the last pointer position"""
+        self._coord_pending = False
+        self._last_coord_t = time.monotonic()
+        if self.window.image_canvas:
+            img_x, img_y = self.image_processor.screen_to_image_coords(*self._coord_pos)
             self.window.image_canvas.update_coordinates(img_x, img_y)
     
     def _on_mouse_press(self, event: tk.Event) -> None:
@@ -258,11 +319,10 @@ class MicroscopyImageAnalyzer:
                 dx = event.x - self.pan_start["x"]
                 dy = event.y - self.pan_start["y"]
                 
-                self.image_processor.canvas_offset["x"] += dx
-                self.image_processor.canvas_offset["y"] += dy
+                self.image_processor.pan_by(dx, dy)
                 
                 self.pan_start = {"x": event.x, "y": event.y}
-                self._update_image_display()
+                self._schedule_redraw()
         elif self.roi_manager:
             # Let ROI manager handle the event
             self.roi_manager.handle_mouse_drag(event)
@@ -272,60 +332,84 @@ class MicroscopyImageAnalyzer:
         if self.roi_manager:
             self.roi_manager.handle_mouse_release(event)
     
+    def _on_canvas_resize(self, event: tk.Event) -> None:
+        """Remember the canvas size so handlers don't query Tk for it"""
+        if event.width <= 1 or event.height <= 1:
+            return
+        if (event.width, event.height) == (self._canvas_w, self._canvas_h):
+            return
+        self._canvas_w = event.width
+        self._canvas_h = event.height
+        
+        # The render window is sized in canvases, so newly exposed area needs a render
+        self.image_processor.mark_dirty()
+        self._schedule_redraw()
+    
     def _on_mouse_wheel(self, event: tk.Event) -> None:
-        """Handle mouse wheel for zooming"""
-        if event.delta > 0:
-            self._on_zoom_in_at_mouse(event.x, event.y)
-        else:
-            self._on_zoom_out_at_mouse(event.x, event.y)
+        """Handle mouse wheel for zooming, applying a burst of notches as one zoom"""
+        self._wheel_steps += 1 if event.delta > 0 else -1
+        self._wheel_focus = (event.x, event.y)
+        
+        canvas = self.window.get_canvas()
+        if canvas and not self._wheel_pending:
+            self._wheel_pending = True
+            canvas.after_idle(self._flush_wheel)
+    
+    def _flush_wheel(self) -> None:
+        """Apply the wheel notches accumulated since the last idle cycle"""
+        self._wheel_pending = False
+        steps, self._wheel_steps = self._wheel_steps, 0
+        if steps:
+            self._interacting = True
+            self.image_processor.zoom_by(AppConfig.ZOOM_FACTOR ** steps, *self._wheel_focus)
+            self._schedule_redraw()
+            
+            canvas = self.window.get_canvas()
+            if canvas:
+                if self._settle_job:
+                    canvas.after_cancel(self._settle_job)
+                self._settle_job = canvas.after(AppConfig.SETTLE_DELAY_MS, self._on_interaction_settled)
+    
+    def _on_interaction_settled(self) -> None:
+        """Redraw at full quality once wheel zooming has stopped"""
+        self._settle_job = None
+        self._interacting = False
+        self.image_processor.mark_dirty()
+        self._schedule_redraw()
     
     def _on_previous_image(self) -> None:
         """Handle previous image navigation"""
-        canvas = self.window.get_canvas()
-        if canvas and self.image_processor.previous_image():
-            if self.image_processor.load_current_image(
-                canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
-            ):
-                self._update_image_display()
-                self._update_image_counter()
-                
-                # Re-center on cell if coordinates are set
-                if self.image_processor.cell_coords["x"] != 0 or self.image_processor.cell_coords["y"] != 0:
-                    self.image_processor.center_on_coordinates(
-                        self.image_processor.cell_coords["x"], self.image_processor.cell_coords["y"],
-                        canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                        canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
-                    )
-                    self._update_image_display()
+        if self.window.get_canvas() and self.image_processor.previous_image():
+            self._show_current_image()
     
     def _on_next_image(self) -> None:
         """Handle next image navigation"""
-        canvas = self.window.get_canvas()
-        if canvas and self.image_processor.next_image():
-            if self.image_processor.load_current_image(
-                canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
-            ):
-                self._update_image_display()
-                self._update_image_counter()
-                
-                # Re-center on cell if coordinates are set
-                if self.image_processor.cell_coords["x"] != 0 or self.image_processor.cell_coords["y"] != 0:
-                    self.image_processor.center_on_coordinates(
-                        self.image_processor.cell_coords["x"], self.image_processor.cell_coords["y"],
-                        canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                        canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
-                    )
-                    self._update_image_display()
+        if self.window.get_canvas() and self.image_processor.next_image():
+            self._show_current_image()
+    
+    def _show_current_image(self) -> None:
+        """Load the current image, re-centre on the cell if set, then redraw once"""
+        if not self.image_processor.load_current_image(self._canvas_w, self._canvas_h):
+            return
+        
+        # Re-center on cell if coordinates are set
+        if self.image_processor.cell_x != 0 or self.image_processor.cell_y != 0:
+            self.image_processor.center_on_coordinates(
+                self.image_processor.cell_x, self.image_processor.cell_y,
+                self._canvas_w,
+                self._canvas_h
+            )
+        
+        self._schedule_redraw()
+        self._update_image_counter()
     
     def _on_zoom_in(self) -> None:
         """Handle zoom in button"""
         canvas = self.window.get_canvas()
         if canvas:
             # Zoom towards center
-            center_x = canvas.winfo_width() // 2
-            center_y = canvas.winfo_height() // 2
+            center_x = self._canvas_w // 2
+            center_y = self._canvas_h // 2
             self._on_zoom_in_at_mouse(center_x, center_y)
     
     def _on_zoom_out(self) -> None:
@@ -333,32 +417,32 @@ class MicroscopyImageAnalyzer:
         canvas = self.window.get_canvas()
         if canvas:
             # Zoom from center
-            center_x = canvas.winfo_width() // 2
-            center_y = canvas.winfo_height() // 2
+            center_x = self._canvas_w // 2
+            center_y = self._canvas_h // 2
             self._on_zoom_out_at_mouse(center_x, center_y)
     
     def _on_zoom_in_at_mouse(self, mouse_x: int, mouse_y: int) -> None:
         """Zoom in at specific mouse position"""
         self.image_processor.zoom_in(mouse_x, mouse_y)
-        self._update_image_display()
+        self._schedule_redraw()
     
     def _on_zoom_out_at_mouse(self, mouse_x: int, mouse_y: int) -> None:
         """Zoom out from specific mouse position"""
         self.image_processor.zoom_out(mouse_x, mouse_y)
-        self._update_image_display()
+        self._schedule_redraw()
     
     def _on_reset_view(self) -> None:
         """Handle reset view"""
         self.image_processor.reset_view()
         
         # Re-center on cell if coordinates are set
-        if self.image_processor.cell_coords["x"] != 0 or self.image_processor.cell_coords["y"] != 0:
+        if self.image_processor.cell_x != 0 or self.image_processor.cell_y != 0:
             canvas = self.window.get_canvas()
             if canvas:
                 self.image_processor.center_on_coordinates(
-                    self.image_processor.cell_coords["x"], self.image_processor.cell_coords["y"],
-                    canvas.winfo_width() or AppConfig.CANVAS_WIDTH,
-                    canvas.winfo_height() or AppConfig.CANVAS_HEIGHT
+                    self.image_processor.cell_x, self.image_processor.cell_y,
+                    self._canvas_w,
+                    self._canvas_h
                 )
         
         self._update_image_display()
@@ -381,8 +465,10 @@ class MicroscopyImageAnalyzer:
             self.roi_manager.clear_roi()
         
         # Clear cell coordinates
-        self.image_processor.cell_coords = {"x": 0, "y": 0}
+        self.image_processor.cell_x = 0
+        self.image_processor.cell_y = 0
         self.image_processor.show_crosshair = False
+        self.image_processor.mark_dirty()
         if self.window.cell_controls:
             self.window.cell_controls.clear_coordinates()
         
@@ -405,33 +491,202 @@ class MicroscopyImageAnalyzer:
             width, height = self.roi_manager.get_roi_dimensions()
             self.window.roi_controls.update_dimensions(width, height)
     
+    def _post_status(self, message: str, status_type: str = "normal") -> None:
+        """Update the status bar after the current event instead of in the middle of it"""
+        self.window.root.after(0, self.window.update_status, message, status_type)
+    
+    def _schedule_redraw(self) -> None:
+        """Request a redraw, coalescing bursts of pan/zoom events into one per frame"""
+        if self._redraw_pending:
+            return
+        canvas = self.window.get_canvas()
+        if not canvas:
+            return
+        self._redraw_pending = True
+        canvas.after(AppConfig.REDRAW_DELAY_MS, self._flush_redraw)
+    
+    def _flush_redraw(self) -> None:
+        """Perform a redraw requested through _schedule_redraw"""
+        self._redraw_pending = False
+        self._update_image_display()
+    
     def _update_image_display(self) -> None:
         """Update the image display on canvas"""
         canvas = self.window.get_canvas()
-        if not canvas:
+        if not canvas or not self.image_processor.is_dirty():
             return
         
-        # Get the resized image
-        tk_image = self.image_processor.get_resized_image()
-        if tk_image:
-            # Clear canvas and draw image
-            canvas.delete("all")
-            canvas.create_image(
-                self.image_processor.canvas_offset["x"],
-                self.image_processor.canvas_offset["y"],
-                anchor=tk.NW,
-                image=tk_image
-            )
-            
-            # Store reference to prevent garbage collection
-            self.image_processor.tk_image = tk_image
-            
-            # Draw crosshair if cell coordinates are set
-            self.image_processor.draw_crosshair(canvas)
+        image = self.image_processor.display_image
+        pyramid = self.image_processor.display_pyramid
+        size = self.image_processor.get_display_size()
+        if size is None:
+            return
+        
+        resample = Image.LANCZOS
+        if self._interacting:
+            # Magnified pixels are blocks anyway; skip interpolation until zooming settles
+            zoomed_in = self.image_processor.scale_factor >= AppConfig.NEAREST_ZOOM
+            resample = Image.NEAREST if zoomed_in else Image.BILINEAR
+        
+        # Only a new image, scale or filter, or panning past the rendered
+        # window needs resizing; otherwise panning just moves the item
+        if (image is not self._render_image or size != self._render_size
+                or resample != self._render_resample or not self._window_covers_view(size)):
+            if image is not self._render_image:
+                self._resize_cache.clear()
+            elif (self._image_item is not None and size == self._render_size
+                    and resample == self._render_resample):
+                # Panned past the window: keep the old one moving until the new one is ready
+                canvas.coords(
+                    self._image_item,
+                    self.image_processor.offset_x + self._render_window[0],
+                    self.image_processor.offset_y + self._render_window[1]
+                )
+            window = self._visible_window(size)
+            self._render_image = image
+            self._render_size = size
+            self._render_resample = resample
+            self._render_window = window
+            self._render_gen += 1  # Any resize still in flight is now stale
             
-            # Update ROI display
-            if self.roi_manager:
-                self.roi_manager.update_display()
+            key = (size, resample, window)
+            cached = self._resize_cache.get(key)
+            if cached is not None:
+                self._resize_cache.move_to_end(key)
+                self._show_resized_image(canvas, cached)
+            else:
+                self._render_job_gen = self._render_gen
+                self._render_jobs.put((self._render_gen, pyramid, size, resample, window))
+                if not self._render_polling:
+                    self._render_polling = True
+                    canvas.after(AppConfig.RENDER_POLL_MS, self._poll_render_results)
+        elif self._image_item is not None:
+            canvas.coords(
+                self._image_item,
+                self.image_processor.offset_x + self._render_window[0],
+                self.image_processor.offset_y + self._render_window[1]
+            )
+        
+        # Draw crosshair if cell coordinates are set
+        self.image_processor.draw_crosshair(canvas, self._canvas_w, self._canvas_h)
+        
+        # Update ROI display
+        if self.roi_manager:
+            self.roi_manager.update_display()
+        
+        self.image_processor.mark_clean()
+    
+    def _visible_window(self, size: tuple) -> tuple:
+        """Get the part of the scaled image to render, as (x0, y0, x1, y1).
+        
+        Along an axis where the image is more than three canvases long, only
+        the visible span plus about one canvas either side is rendered, so
+        deep zooms resample what can be seen instead of the whole image.
+        Window starts snap to whole canvases so nearby views share a window.
+        """
+        spans = []
+        for length, view, offset in ((size[0], self._canvas_w, self.image_processor.offset_x),
+                                     (size[1], self._canvas_h, self.image_processor.offset_y)):
+            if length <= 3 * view:
+                spans.append((0, length))
+            else:
+                start = (int(-offset) // view - 1) * view
+                spans.append((max(0, start), min(length, start + 3 * view)))
+        (x0, x1), (y0, y1) = spans
+        return x0, y0, x1, y1
+    
+    def _window_covers_view(self, size: tuple) -> bool:
+        """Check whether the rendered window still contains everything visible"""
+        window = self._render_window
+        if window is None:
+            return False
+        for low, high, length, view, offset in (
+                (window[0], window[2], size[0], self._canvas_w, self.image_processor.offset_x),
+                (window[1], window[3], size[1], self._canvas_h, self.image_processor.offset_y)):
+            visible_low = max(0, -offset)
+            visible_high = min(length, view - offset)
+            if visible_low < visible_high and (visible_low < low or visible_high > high):
+                return False
+        return True
+    
+    def _render_worker(self) -> None:
+        """Resize images for display off the Tk thread"""
+        while True:
+            job = self._render_jobs.get()
+            # Only the newest request matters; skip any that queued up behind it
+            while not self._render_jobs.empty():
+                job = self._render_jobs.get_nowait()
+            gen, pyramid, size, resample, window = job
+            try:
+                resized = ImageProcessor.resize_for_display(pyramid, size, resample, window)
+            except Exception as e:
+                # Reported from the Tk thread; the worker keeps serving later requests
+                self._render_results.put((gen, None, str(e)))
+            else:
+                self._render_results.put((gen, resized, None))
+    
+    def _poll_render_results(self) -> None:
+        """Show the latest resized image once the worker has produced it"""
+        canvas = self.window.get_canvas()
+        done = False
+        while True:
+            try:
+                gen, resized, error = self._render_results.get_nowait()
+            except queue.Empty:
+                break
+            if gen != self._render_gen:
+                continue
+            done = True
+            if resized is None:
+                # Resize failed: keep the previous image. The view is already marked
+                # clean, so it is rendered again only after the next pan, zoom or
+                # image change; retrying at once could repeat a failure every frame
+                self._render_image = None
+                self._post_status(f"Failed to display image: {error}", "error")
+            else:
+                key = (self._render_size, self._render_resample, self._render_window)
+                self._resize_cache[key] = resized
+                while len(self._resize_cache) > AppConfig.RESIZE_CACHE_SIZE:
+                    self._resize_cache.popitem(last=False)
+                if canvas:
+                    self._show_resized_image(canvas, resized)
+        
+        # Stop once the current view is shown or was served from the resize cache
+        if done or not canvas or self._render_job_gen != self._render_gen:
+            self._render_polling = False
+        else:
+            canvas.after(AppConfig.RENDER_POLL_MS, self._poll_render_results)
+    
+    def _show_resized_image(self, canvas: tk.Canvas, resized: Image.Image) -> None:
+        """Put a resized image on the canvas at the current offset and render window"""
+        # Paste into a pooled PhotoImage of the same size and mode, and only
+        # allocate a new one for a size that isn't in the pool
+        photo_key = (resized.size, resized.mode)
+        photo = self._photo_pool.get(photo_key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(resized)
+            self._photo_pool[photo_key] = photo
+            while len(self._photo_pool) > AppConfig.PHOTO_POOL_SIZE:
+                self._photo_pool.popitem(last=False)
+        else:
+            self._photo_pool.move_to_end(photo_key)
+            photo.paste(resized)
+        self._photo = photo
+        
+        # Reuse the image item; crosshair and ROI items stay above it
+        offset_x = self.image_processor.offset_x + self._render_window[0]
+        offset_y = self.image_processor.offset_y + self._render_window[1]
+        if self._image_item is None:
+            self._image_item = canvas.create_image(
+                offset_x, offset_y, anchor=tk.NW, image=self._photo
+            )
+            canvas.tag_lower(self._image_item)
+        else:
+            canvas.itemconfig(self._image_item, image=self._photo)
+            canvas.coords(self._image_item, offset_x, offset_y)
+        
+        # Store reference to prevent garbage collection
+        self.image_processor.tk_image = self._photo
     
     def _update_image_counter(self) -> None:
         """Update image counter display"""
@@ -2,7 +2,24 @@
 Core functionality modules
 """
 
-from .image_processor import ImageProcessor
-from .roi_manager import ROIManager
-
 __all__ = ["ImageProcessor", "ROIManager"]
+
+_SUBMODULES = {
+    "ImageProcessor": "image_processor",
+    "ROIManager": "roi_manager",
+}
+
+
+def __getattr__(name):
+    """Import the core classes lazily so that `import src.core` stays cheap"""
+    if name in _SUBMODULES:
+        from importlib import import_module
+        value = getattr(import_module(f".{_SUBMODULES[name]}", __name__), name)
+        globals()[name] = value  # later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported names in dir(src.core)"""
+    return sorted(set(globals()) | set(__all__))
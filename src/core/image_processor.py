@@ -3,15 +3,44 @@ Core image processing functionality for the Microscopy Image Analyzer
 """
 
 import os
-import glob
+import shutil
+import threading
 import numpy as np
 import imageio
 import tkinter as tk
 from PIL import Image, ImageTk
 from tkinter import messagebox
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from typing import List, Tuple, Optional, Dict, Any
 
 from config.settings import AppConfig
+from src.utils.file_utils import get_image_files
+
+
+def _crop_one(image_path: str, roi: Tuple[float, float, float, float]) -> Image.Image:
+    """Open one image and return its ROI crop"""
+    # crop() loads the source and copies the region into a new image, so the
+    # result stays valid after the file is closed without an extra copy()
+    with Image.open(image_path) as img:
+        return img.crop(roi)
+
+
+def _save_one(image: Image.Image, output_path: str, source_path: Optional[str] = None) -> None:
+    """Save one cropped image, or copy `source_path` as is when the crop covers all of it"""
+    if source_path is not None:
+        with Image.open(source_path) as source:
+            whole = source.size == image.size  # Reads the header only
+        if whole:
+            shutil.copyfile(source_path, output_path)
+            return
+    
+    if output_path.lower().endswith('.png'):
+        # Pillow's default level 6 spends most of the save time searching for matches
+        image.save(output_path, compress_level=AppConfig.PNG_COMPRESS_LEVEL)
+    else:
+        image.save(output_path)
 
 
 class ImageProcessor:
@@ -22,28 +51,53 @@ class ImageProcessor:
         self.current_image_index: int = 0
         self.original_image: Optional[Image.Image] = None
         self.display_image: Optional[Image.Image] = None
+        # display_image followed by its 2x reductions, filled in lazily while rendering
+        self.display_pyramid: List[Image.Image] = []
+        self._fit_size: Tuple[int, int] = (AppConfig.CANVAS_WIDTH, AppConfig.CANVAS_HEIGHT)
         self.tk_image: Optional[ImageTk.PhotoImage] = None
         self.scale_factor: float = 1.0
         self.default_scale: Optional[float] = None
-        self.canvas_offset: Dict[str, int] = {"x": 0, "y": 0}
+        # Canvas position of the image's top-left corner
+        self.offset_x: float = 0
+        self.offset_y: float = 0
         self.cropped_images: List[Image.Image] = []
+        self._crop_box: Optional[Tuple[int, int, int, int]] = None
+        self._crop_sources: List[str] = []  # Files the cropped images were cut from
         
         # Cell location and crosshair
-        self.cell_coords: Dict[str, int] = {"x": 0, "y": 0}
+        self.cell_x: int = 0
+        self.cell_y: int = 0
         self.show_crosshair: bool = False
         self.crosshair_lines: List[int] = []
         
+        # Set whenever something visible changes; cleared once the canvas is redrawn
+        self._dirty: bool = True
+        
+        # Decoded images by path (LRU), stored as display pyramids whose first
+        # level is the full-resolution image, and neighbour decodes still in flight
+        self._decode_cache: "OrderedDict[str, List[Image.Image]]" = OrderedDict()
+        self._pending_decodes: Dict[str, Future] = {}
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-prefetch")
+        self._folder_generation: int = 0  # Prefetches from an older folder are discarded
+        
     def load_images_from_folder(self, folder_path: str) -> bool:
         """Load all supported images from a folder"""
-        self.image_paths = []
+        self.image_paths = get_image_files(folder_path)  # Sorted for consistent ordering
+        with self._cache_lock:
+            self._decode_cache.clear()
+            for future in self._pending_decodes.values():
+                future.cancel()
+            self._pending_decodes.clear()
+            self._folder_generation += 1
         
-        for ext in AppConfig.SUPPORTED_FORMATS:
-            self.image_paths.extend(glob.glob(os.path.join(folder_path, ext)))
+        # Crops taken from the previous folder must not be matched to these files
+        self._crop_box = None
+        self._crop_sources = []
         
         if not self.image_paths:
             return False
             
-        self.image_paths.sort()  # Sort for consistent ordering
         self.current_image_index = 0
         return True
     
@@ -54,8 +108,12 @@ class ImageProcessor:
             
         try:
             image_path = self.image_paths[self.current_image_index]
-            self.original_image = Image.open(image_path)
-            self.display_image = self.original_image.copy()
+            # Decoded images are shared with the cache and never modified in place
+            self.display_pyramid = self._get_decoded_pyramid(image_path)
+            self.original_image = self.display_pyramid[0]
+            self.display_image = self.original_image
+            self._dirty = True
+            self._fit_size = (canvas_width, canvas_height)
             
             # Calculate default scale to fit image to canvas
             img_w, img_h = self.original_image.size
@@ -64,67 +122,229 @@ class ImageProcessor:
             self.default_scale = min(scale_w, scale_h, 1.0)  # Don't scale up beyond 100%
             
             self.reset_view()
+            self.prefetch_neighbors()
             return True
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {str(e)}")
             return False
     
-    def get_resized_image(self) -> Optional[ImageTk.PhotoImage]:
-        """Get the current image resized according to scale factor"""
+    def prefetch_neighbors(self) -> None:
+        """Decode the previous and next images in the background"""
+        if len(self.image_paths) < 2:
+            return
+        
+        for step in (1, -1):
+            path = self.image_paths[(self.current_image_index + step) % len(self.image_paths)]
+            with self._cache_lock:
+                if path in self._decode_cache or path in self._pending_decodes:
+                    continue
+                self._pending_decodes[path] = self._executor.submit(
+                    self._prefetch_image, path, self._fit_size, self._folder_generation
+                )
+    
+    def _prefetch_image(self, image_path: str, fit_size: Tuple[int, int],
+                        generation: int) -> List[Image.Image]:
+        """Decode an image on a worker thread, pre-shrink it for display and cache it"""
+        try:
+            pyramid = [self._decode_image(image_path)]
+            
+            # Build the reductions down to the fit-to-canvas size now, so the
+            # first redraw after navigating only has a small resize left to do
+            image = pyramid[0]
+            scale = min(fit_size[0] / image.width, fit_size[1] / image.height, 1.0)
+            self._pyramid_level(pyramid, (int(image.width * scale), int(image.height * scale)))
+            
+            self._cache_image(image_path, pyramid, generation)
+            return pyramid
+        finally:
+            with self._cache_lock:
+                if generation == self._folder_generation:
+                    self._pending_decodes.pop(image_path, None)
+    
+    def _get_decoded_pyramid(self, image_path: str) -> List[Image.Image]:
+        """Get a decoded image pyramid from the cache, a pending prefetch, or disk"""
+        with self._cache_lock:
+            pyramid = self._decode_cache.get(image_path)
+            if pyramid is not None:
+                self._decode_cache.move_to_end(image_path)
+                return pyramid
+            pending = self._pending_decodes.get(image_path)
+        
+        if pending is not None:
+            return pending.result()
+        
+        pyramid = [self._decode_image(image_path)]
+        self._cache_image(image_path, pyramid)
+        return pyramid
+    
+    def _cache_image(self, image_path: str, pyramid: List[Image.Image],
+                     generation: Optional[int] = None) -> None:
+        """Store a decoded image pyramid, evicting the least recently used ones"""
+        with self._cache_lock:
+            if generation is not None and generation != self._folder_generation:
+                return
+            self._decode_cache[image_path] = pyramid
+            self._decode_cache.move_to_end(image_path)
+            while len(self._decode_cache) > AppConfig.IMAGE_CACHE_SIZE:
+                self._decode_cache.popitem(last=False)
+    
+    @staticmethod
+    def _decode_image(image_path: str) -> Image.Image:
+        """Read and fully decode an image file"""
+        with Image.open(image_path) as image:
+            image.load()
+        return image
+    
+    def get_display_size(self) -> Optional[Tuple[int, int]]:
+        """Get the displayed image size for the current scale factor"""
         if not self.display_image:
             return None
             
-        try:
-            width, height = self.display_image.size
+        width, height = self.display_image.size
+        new_width = int(width * self.scale_factor)
+        new_height = int(height * self.scale_factor)
+        
+        # Prevent excessive memory usage
+        max_size = AppConfig.MAX_IMAGE_SIZE
+        if new_width > max_size or new_height > max_size:
+            self.scale_factor = min(max_size / width, max_size / height)
             new_width = int(width * self.scale_factor)
             new_height = int(height * self.scale_factor)
-            
-            # Prevent excessive memory usage
-            if new_width > AppConfig.MAX_IMAGE_SIZE or new_height > AppConfig.MAX_IMAGE_SIZE:
-                self.scale_factor = min(
-                    AppConfig.MAX_IMAGE_SIZE / width,
-                    AppConfig.MAX_IMAGE_SIZE / height
-                )
-                new_width = int(width * self.scale_factor)
-                new_height = int(height * self.scale_factor)
-            
-            resized_image = self.display_image.resize((new_width, new_height), Image.LANCZOS)
-            return ImageTk.PhotoImage(resized_image)
-            
-        except Exception as e:
-            print(f"Resize error: {str(e)}")
-            return self.tk_image  # Return previous image if resize fails
+        
+        return new_width, new_height
+    
+    @staticmethod
+    def resize_for_display(pyramid: List[Image.Image], size: Tuple[int, int],
+                           resample: int = Image.LANCZOS,
+                           window: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        """Resize for display from the smallest pyramid level that is still at least `size`.
+        
+        With a `window` (x0, y0, x1, y1) in display pixels, only that part of
+        the scaled image is produced. Missing levels are appended to the
+        pyramid, so it must only be used from one thread at a time (the
+        render worker). Errors are raised to the caller, which reports them.
+        """
+        if window is not None and window != (0, 0) + tuple(size):
+            return ImageProcessor._resize_window(pyramid, size, resample, window)
+        source = ImageProcessor._pyramid_level(pyramid, size)
+        if source.size == size:
+            resized = source  # 100% zoom (or an exact pyramid level): nothing to resample
+        elif size[0] > source.width or size[1] > source.height:
+            # Lanczos adds nothing when enlarging
+            upscale = Image.NEAREST if resample == Image.NEAREST else Image.BILINEAR
+            resized = source.resize(size, upscale)
+        else:
+            # The cheap filters used while interacting are left as they are;
+            # only the settled high-quality pass may take the reduce() shortcut
+            resized = None
+            if resample == Image.LANCZOS:
+                resized = ImageProcessor._reduce_to_size(pyramid, size)
+            if resized is None:
+                resized = source.resize(size, resample)
+        return ImageProcessor._to_display_mode(resized)
+    
+    @staticmethod
+    def _reduce_to_size(pyramid: List[Image.Image], size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Box-reduce the smallest pyramid level that is a near-integer multiple of `size`.
+        
+        Covers ratios the 2x pyramid cannot hit exactly (1/3, 1/5, ...), where
+        reduce() averages blocks without a kernel. Returns None when no level
+        fits on both axes or the mode isn't supported by reduce().
+        """
+        for level in reversed(pyramid):
+            x_ratio = level.width / size[0]
+            y_ratio = level.height / size[1]
+            factor = round(x_ratio)
+            if factor < 3 or abs(x_ratio - factor) >= 0.02 or abs(y_ratio - factor) >= 0.02:
+                continue
+            try:
+                resized = level.reduce(factor)
+            except ValueError:
+                return None
+            if resized.size != size:
+                resized = resized.resize(size, Image.BILINEAR)
+            return resized
+        return None
+    
+    @staticmethod
+    def _resize_window(pyramid: List[Image.Image], size: Tuple[int, int], resample: int,
+                       window: Tuple[int, int, int, int]) -> Image.Image:
+        """Resample just one window of the scaled image from the closest pyramid level"""
+        source = ImageProcessor._pyramid_level(pyramid, size)
+        x0, y0, x1, y1 = window
+        if source.size == size:
+            resized = source.crop(window)
+        else:
+            if size[0] > source.width or size[1] > source.height:
+                resample = Image.NEAREST if resample == Image.NEAREST else Image.BILINEAR
+            sx = source.width / size[0]
+            sy = source.height / size[1]
+            resized = source.resize(
+                (x1 - x0, y1 - y0), resample, box=(x0 * sx, y0 * sy, x1 * sx, y1 * sy)
+            )
+        return ImageProcessor._to_display_mode(resized)
+    
+    @staticmethod
+    def _pyramid_level(pyramid: List[Image.Image], size: Tuple[int, int]) -> Image.Image:
+        """Get the smallest level that is still at least `size`, adding missing 2x reductions"""
+        level = 0
+        source = pyramid[0]
+        while source.width // 2 >= size[0] and source.height // 2 >= size[1]:
+            level += 1
+            if level == len(pyramid):
+                try:
+                    pyramid.append(source.reduce(2))
+                except ValueError:
+                    break  # Mode not supported by reduce(); resample from here
+            source = pyramid[level]
+        return source
+    
+    @staticmethod
+    def _to_display_mode(image: Image.Image) -> Image.Image:
+        """Convert to a mode that ImageTk.PhotoImage.paste copies without converting"""
+        if image.mode in ("1", "L", "RGB", "RGBA"):
+            return image
+        if image.mode == "P":
+            return image.convert("RGBA" if "transparency" in image.info else "RGB")
+        return image.convert(Image.getmodebase(image.mode))
     
     def zoom_in(self, mouse_x: int, mouse_y: int) -> None:
         """Zoom in towards mouse position"""
-        if not self.display_image:
-            return
-            
-        old_scale = self.scale_factor
-        self.scale_factor = min(self.scale_factor * AppConfig.ZOOM_FACTOR, AppConfig.MAX_ZOOM)
-        
-        # Calculate new offset to zoom toward mouse position
-        self.canvas_offset["x"] = mouse_x - (mouse_x - self.canvas_offset["x"]) * (self.scale_factor / old_scale)
-        self.canvas_offset["y"] = mouse_y - (mouse_y - self.canvas_offset["y"]) * (self.scale_factor / old_scale)
+        self.zoom_by(AppConfig.ZOOM_FACTOR, mouse_x, mouse_y)
     
     def zoom_out(self, mouse_x: int, mouse_y: int) -> None:
         """Zoom out from mouse position"""
-        if not self.display_image:
+        self.zoom_by(1 / AppConfig.ZOOM_FACTOR, mouse_x, mouse_y)
+    
+    def zoom_by(self, factor: float, mouse_x: int, mouse_y: int) -> None:
+        """Zoom by a combined factor, keeping the point under the mouse fixed"""
+        if not self.display_image or factor == 1:
             return
             
         old_scale = self.scale_factor
-        self.scale_factor = max(self.scale_factor / AppConfig.ZOOM_FACTOR, AppConfig.MIN_ZOOM)
+        new_scale = old_scale * factor
+        if new_scale < AppConfig.MIN_ZOOM:
+            new_scale = AppConfig.MIN_ZOOM
+        elif new_scale > AppConfig.MAX_ZOOM:
+            new_scale = AppConfig.MAX_ZOOM
         
-        # Don't go below default scale
-        if self.default_scale and self.scale_factor < self.default_scale:
-            self.scale_factor = self.default_scale
+        # Don't go below default scale when zooming out
+        if factor < 1 and self.default_scale and new_scale < self.default_scale:
             self.reset_view()
             return
         
-        # Calculate new offset
-        self.canvas_offset["x"] = mouse_x - (mouse_x - self.canvas_offset["x"]) * (self.scale_factor / old_scale)
-        self.canvas_offset["y"] = mouse_y - (mouse_y - self.canvas_offset["y"]) * (self.scale_factor / old_scale)
+        # Calculate new offset to zoom toward mouse position
+        self.scale_factor = new_scale
+        ratio = new_scale / old_scale
+        self.offset_x = mouse_x - (mouse_x - self.offset_x) * ratio
+        self.offset_y = mouse_y - (mouse_y - self.offset_y) * ratio
+    
+    def pan_by(self, dx: float, dy: float) -> None:
+        """Move the view by a screen-space delta"""
+        self.offset_x += dx
+        self.offset_y += dy
+        self._dirty = True
     
     def reset_view(self) -> None:
         """Reset view to default scale and position"""
@@ -132,36 +352,59 @@ class ImageProcessor:
             return
             
         self.scale_factor = self.default_scale
-        self.canvas_offset = {"x": 0, "y": 0}
+        self.offset_x = 0
+        self.offset_y = 0
+        self._dirty = True
     
     def set_cell_coordinates(self, x: int, y: int) -> None:
         """Set cell coordinates and show crosshair"""
-        self.cell_coords = {"x": x, "y": y}
+        self.cell_x = x
+        self.cell_y = y
         self.show_crosshair = True
+        self._dirty = True
     
     def toggle_crosshair(self) -> bool:
         """Toggle crosshair visibility"""
         self.show_crosshair = not self.show_crosshair
         return self.show_crosshair
     
-    def draw_crosshair(self, canvas: tk.Canvas) -> None:
-        """Draw crosshair lines at cell coordinates"""
-        # Clear existing crosshair
-        for line_id in self.crosshair_lines:
-            canvas.delete(line_id)
-        self.crosshair_lines.clear()
-        
+    def is_dirty(self) -> bool:
+        """Check whether the view changed since the last redraw"""
+        return self._dirty
+    
+    def mark_dirty(self) -> None:
+        """Force the next redraw, e.g. after changing view state directly"""
+        self._dirty = True
+    
+    def mark_clean(self) -> None:
+        """Record that the canvas shows the current view"""
+        self._dirty = False
+    
+    def draw_crosshair(self, canvas: tk.Canvas, canvas_width: Optional[int] = None,
+                       canvas_height: Optional[int] = None) -> None:
+        """Draw crosshair lines at cell coordinates, reusing existing canvas items"""
         if not self.show_crosshair or not self.original_image:
+            for line_id in self.crosshair_lines:
+                canvas.itemconfig(line_id, state=tk.HIDDEN)
             return
         
         # Get screen coordinates of cell
-        screen_x, screen_y = self.image_to_screen_coords(
-            self.cell_coords["x"], self.cell_coords["y"]
-        )
+        screen_x, screen_y = self.image_to_screen_coords(self.cell_x, self.cell_y)
+        
+        # Get canvas dimensions unless the caller already knows them
+        if canvas_width is None:
+            canvas_width = canvas.winfo_width()
+        if canvas_height is None:
+            canvas_height = canvas.winfo_height()
         
-        # Get canvas dimensions
-        canvas_width = canvas.winfo_width()
-        canvas_height = canvas.winfo_height()
+        if self.crosshair_lines:
+            v_line, h_line, center_point = self.crosshair_lines
+            canvas.coords(v_line, screen_x, 0, screen_x, canvas_height)
+            canvas.coords(h_line, 0, screen_y, canvas_width, screen_y)
+            canvas.coords(center_point, screen_x - 3, screen_y - 3, screen_x + 3, screen_y + 3)
+            for line_id in self.crosshair_lines:
+                canvas.itemconfig(line_id, state=tk.NORMAL)
+            return
         
         # Draw vertical line
         v_line = canvas.create_line(
@@ -193,19 +436,47 @@ class ImageProcessor:
         target_x = x * self.scale_factor
         target_y = y * self.scale_factor
         
-        self.canvas_offset["x"] = (canvas_width // 2) - target_x
-        self.canvas_offset["y"] = (canvas_height // 2) - target_y
+        self.offset_x = (canvas_width // 2) - target_x
+        self.offset_y = (canvas_height // 2) - target_y
+        self._dirty = True
+    
+    @property
+    def scale_factor(self) -> float:
+        """Display scale (screen pixels per image pixel)"""
+        return self._scale_factor
+    
+    @scale_factor.setter
+    def scale_factor(self, value: float) -> None:
+        # Keep the inverse alongside so per-motion conversions multiply instead of divide
+        self._scale_factor = value
+        self._inv_scale = 1.0 / value
+        self._dirty = True
+    
+    @property
+    def inv_scale(self) -> float:
+        """Image pixels per screen pixel, kept in step with scale_factor"""
+        return self._inv_scale
     
     def screen_to_image_coords(self, screen_x: int, screen_y: int) -> Tuple[int, int]:
         """Convert screen coordinates to image coordinates"""
-        img_x = (screen_x - self.canvas_offset["x"]) / self.scale_factor
-        img_y = (screen_y - self.canvas_offset["y"]) / self.scale_factor
+        img_x = (screen_x - self.offset_x) * self._inv_scale
+        img_y = (screen_y - self.offset_y) * self._inv_scale
         return int(img_x), int(img_y)
     
+    def screen_to_image_array(self, points: np.ndarray) -> np.ndarray:
+        """Convert an (N, 2) array of screen points to image coordinates"""
+        offset = np.array([self.offset_x, self.offset_y], dtype=float)
+        return (np.asarray(points, dtype=float) - offset) * self._inv_scale
+    
+    def image_to_screen_array(self, points: np.ndarray) -> np.ndarray:
+        """Convert an (N, 2) array of image points to screen coordinates"""
+        offset = np.array([self.offset_x, self.offset_y], dtype=float)
+        return np.asarray(points, dtype=float) * self.scale_factor + offset
+    
     def image_to_screen_coords(self, img_x: float, img_y: float) -> Tuple[int, int]:
         """Convert image coordinates to screen coordinates"""
-        screen_x = img_x * self.scale_factor + self.canvas_offset["x"]
-        screen_y = img_y * self.scale_factor + self.canvas_offset["y"]
+        screen_x = img_x * self.scale_factor + self.offset_x
+        screen_y = img_y * self.scale_factor + self.offset_y
         return int(screen_x), int(screen_y)
     
     def navigate_to_image(self, index: int) -> bool:
@@ -237,20 +508,40 @@ class ImageProcessor:
         if not self.image_paths:
             return False
             
-        x1, y1, x2, y2 = roi_coords
+        # Round the box once here rather than inside every crop() call
+        roi = tuple(round(value) for value in roi_coords)
         self.cropped_images = []
+        self._crop_box = roi
+        self._crop_sources = list(self.image_paths)
         
-        try:
-            for img_path in self.image_paths:
-                with Image.open(img_path) as img:
-                    cropped_img = img.crop((x1, y1, x2, y2))
-                    self.cropped_images.append(cropped_img.copy())
-            return True
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to crop images: {str(e)}")
-            self.cropped_images = []
+        # Images already decoded for viewing are cropped from memory; only the
+        # rest are read from disk
+        with self._cache_lock:
+            decoded = {path: self._decode_cache[path][0]
+                       for path in self.image_paths if path in self._decode_cache}
+        
+        def crop_path(path: str) -> Tuple[Optional[Image.Image], Optional[str]]:
+            try:
+                image = decoded.get(path)
+                return (image.crop(roi) if image else _crop_one(path, roi)), None
+            except Exception as e:
+                return None, f"{os.path.basename(path)}: {str(e)}"
+        
+        # Pillow releases the GIL while decoding and cropping, so threads run
+        # the files in parallel; map keeps the results in folder order
+        workers = min(os.cpu_count() or 1, len(self.image_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(crop_path, self.image_paths))
+        
+        errors = [error for _, error in results if error]
+        if errors:
+            shown = "\n".join(errors[:10])
+            more = f"\n... and {len(errors) - 10} more" if len(errors) > 10 else ""
+            messagebox.showerror("Error", f"Failed to crop {len(errors)} image(s):\n{shown}{more}")
             return False
+        
+        self.cropped_images = [image for image, _ in results]
+        return True
     
     def save_cropped_images(self, export_folder: str) -> bool:
         """Save all cropped images to export folder"""
@@ -260,11 +551,23 @@ class ImageProcessor:
         try:
             os.makedirs(export_folder, exist_ok=True)
             
-            for i, img in enumerate(self.cropped_images):
+            output_paths = []
+            for i in range(len(self.cropped_images)):
                 base_name = os.path.basename(self.image_paths[i])
                 name, ext = os.path.splitext(base_name)
-                output_path = os.path.join(export_folder, f"{name}_cropped{ext}")
-                img.save(output_path)
+                output_paths.append(os.path.join(export_folder, f"{name}_cropped{ext}"))
+            
+            # A box starting at the origin may cover whole images, which are
+            # then copied without decoding and re-encoding
+            if self._crop_box is not None and self._crop_box[:2] == (0, 0):
+                source_paths = self._crop_sources[:len(output_paths)]
+            else:
+                source_paths = [None] * len(output_paths)
+            
+            # Encoding and writing happen in C with the GIL released, so threads overlap them
+            workers = min(AppConfig.SAVE_WORKERS, len(output_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_save_one, self.cropped_images, output_paths, source_paths))
             
             return True
             
@@ -281,8 +584,8 @@ class ImageProcessor:
             os.makedirs(export_folder, exist_ok=True)
             output_path = os.path.join(export_folder, filename)
             
-            frames = [np.array(img.convert('RGB')) for img in self.cropped_images]
-            imageio.mimsave(output_path, frames, duration=AppConfig.GIF_DURATION)
+            self._write_gif(output_path, self._iter_rgb_frames(), self._gif_palette_samples(),
+                            AppConfig.GIF_DURATION)
             
             return True
             
@@ -290,6 +593,39 @@ class ImageProcessor:
             messagebox.showerror("Error", f"Failed to create GIF: {str(e)}")
             return False
     
+    @staticmethod
+    def _write_gif(output_path: str, frames, samples, duration: float, loop: int = 0,
+                   optimize: bool = False) -> None:
+        """Write RGB frames as a GIF with one palette trained on `samples`, with duration in seconds per frame"""
+        # Train one palette on a few evenly spaced frames instead of one per frame,
+        # and map without dithering so unchanged regions stay identical between frames
+        palette = Image.fromarray(np.concatenate(list(samples), axis=0)).quantize(
+            colors=256, method=Image.Quantize.MEDIANCUT
+        )
+        
+        # Frames are mapped to the palette as they arrive, so only the 1-byte
+        # paletted frames are held, plus the previous RGB frame for comparison.
+        # Runs of identical frames collapse into one frame shown for longer
+        images: List[Image.Image] = []
+        durations: List[float] = []
+        previous = None
+        for frame in frames:
+            frame = np.asarray(frame)
+            if previous is not None and np.array_equal(frame, previous):
+                durations[-1] += duration
+                continue
+            images.append(Image.fromarray(frame).quantize(palette=palette, dither=Image.Dither.NONE))
+            durations.append(duration)
+            previous = frame
+        if not images:
+            raise ValueError("No frames to write")
+        
+        images[0].save(
+            output_path, save_all=True, append_images=images[1:],
+            duration=[round(d * 1000) for d in durations],
+            loop=loop, optimize=optimize
+        )
+    
     def create_animation(self, export_folder: str, settings: dict) -> bool:
         """Create animation (GIF or video) from cropped images with custom settings"""
         if not self.cropped_images:
@@ -308,98 +644,63 @@ class ImageProcessor:
             base_path = os.path.join(export_folder, f"{filename}{extension}")
             output_path = self._get_unique_filename(base_path)
             
-            # Validate and convert images to frames
-            frames = []
+            # Check every frame up front (cheap, no pixel access) so a bad one
+            # cannot leave a half-written file behind
+            first = self.cropped_images[0]
+            if first is None or first.width == 0 or first.height == 0:
+                messagebox.showerror("Error", "Image 1 is invalid or empty. Please crop images again.")
+                return False
+            
             for i, img in enumerate(self.cropped_images):
                 if img is None:
                     messagebox.showerror("Error", f"Image {i+1} is invalid (None). Please crop images again.")
                     return False
-                try:
-                    # Convert to RGB format for consistency
-                    rgb_img = img.convert('RGB')
-                    frame_array = np.array(rgb_img)
-                    
-                    # Validate frame dimensions and data type
-                    if frame_array.size == 0:
-                        messagebox.showerror("Error", f"Image {i+1} is empty.")
-                        return False
-                    
-                    # Debug: print frame shape
-                    print(f"Frame {i+1} shape: {frame_array.shape}, dtype: {frame_array.dtype}")
-                    
-                    # Ensure frame has correct dimensions (height, width, 3)
-                    if len(frame_array.shape) != 3 or frame_array.shape[2] != 3:
-                        messagebox.showerror("Error", f"Image {i+1} has invalid dimensions: {frame_array.shape}")
-                        return False
-                    
-                    # Ensure uint8 data type and proper range
-                    if frame_array.dtype != np.uint8:
-                        # Convert to uint8 with proper scaling
-                        if frame_array.max() <= 1.0:
-                            frame_array = (frame_array * 255).astype(np.uint8)
-                        else:
-                            frame_array = frame_array.astype(np.uint8)
-                    
-                    # Ensure values are in valid range
-                    frame_array = np.clip(frame_array, 0, 255)
-                    
-                    frames.append(frame_array)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to process image {i+1}: {str(e)}")
+                if img.size != first.size:
+                    messagebox.showerror(
+                        "Error", f"Image {i+1} has size {img.size}, expected {first.size}."
+                    )
                     return False
             
-            if not frames:
-                messagebox.showerror("Error", "No valid frames to create animation.")
-                return False
-            
-            # Debug info
-            print(f"Creating {export_type} with {len(frames)} frames")
-            if frames:
-                print(f"Final frame shape: {frames[0].shape}, dtype: {frames[0].dtype}")
-                print(f"Frame value range: {frames[0].min()} to {frames[0].max()}")
+            # Frames are converted one at a time as the writer consumes them
+            frames = self._iter_rgb_frames()
             
             if export_type == 'gif':
                 # Create GIF with custom settings
-                gif_kwargs = {
-                    'duration': settings.get('duration_per_frame', 0.2),
-                    'loop': settings.get('loop_count', 0)
-                }
-                
-                if settings.get('optimize', True):
-                    gif_kwargs['optimize'] = True
-                    
-                imageio.mimsave(output_path, frames, **gif_kwargs)
+                self._write_gif(
+                    output_path, frames, self._gif_palette_samples(),
+                    settings.get('duration_per_frame', 0.2),
+                    loop=settings.get('loop_count', 0),
+                    optimize=settings.get('optimize', True)
+                )
                 
             elif export_type == 'video':
                 # Create MP4 video with simpler approach
                 fps = settings.get('fps', 5.0)
                 
+                # Encode time grows with the pixel count, so huge crops are
+                # scaled down before they reach the encoder
+                max_dim = settings.get('max_dim', AppConfig.VIDEO_MAX_DIMENSION)
+                scale = min(1.0, max_dim / max(first.size))
+                video_size = None
+                if scale < 1.0:
+                    video_size = (max(1, int(first.width * scale)), max(1, int(first.height * scale)))
+                frames = self._iter_rgb_frames(video_size)
+                
                 # Method 1: Try basic imageio approach first
                 try:
-                    # Convert frames to a simple format that imageio can handle
-                    simple_frames = []
-                    for frame in frames:
-                        # Ensure frame is in the right format
-                        if frame.shape[2] == 3:  # RGB
-                            simple_frames.append(frame)
-                        else:
-                            # Convert to RGB if needed
-                            simple_frames.append(frame[:,:,:3])
-                    
-                    # Use basic imageio mimsave
-                    imageio.mimsave(output_path, simple_frames, fps=fps, format='MP4')
-                    print(f"Video created successfully: {output_path}")
+                    with imageio.get_writer(output_path, fps=fps, format='MP4') as writer:
+                        for frame in frames:
+                            writer.append_data(frame)
                     
                 except Exception as e1:
                     print(f"MP4 creation failed: {e1}")
                     
                     # Method 2: Try using FFMPEG writer directly
                     try:
-                        writer = imageio.get_writer(output_path, fps=fps, format='FFMPEG', codec='libx264')
-                        for frame in frames:
-                            writer.append_data(frame)
-                        writer.close()
-                        print(f"Video created with FFMPEG writer: {output_path}")
+                        with imageio.get_writer(output_path, fps=fps, format='FFMPEG',
+                                                codec='libx264') as writer:
+                            for frame in self._iter_rgb_frames(video_size):
+                                writer.append_data(frame)
                         
                     except Exception as e2:
                         print(f"FFMPEG writer failed: {e2}")
@@ -410,12 +711,12 @@ class ImageProcessor:
                             os.makedirs(temp_dir, exist_ok=True)
                             
                             # Save frames as individual images
-                            for i, frame in enumerate(frames):
+                            for i, frame in enumerate(self._iter_rgb_frames()):
                                 frame_path = os.path.join(temp_dir, f"frame_{i:04d}.png")
                                 Image.fromarray(frame).save(frame_path)
                             
                             messagebox.showinfo("Video Creation Alternative", 
-                                f"Video creation failed, but {len(frames)} individual frames have been saved to:\\n"
+                                f"Video creation failed, but {len(self.cropped_images)} individual frames have been saved to:\\n"
                                 f"{temp_dir}\\n\\n"
                                 f"You can use external tools like FFmpeg to create a video from these frames.\\n\\n"
                                 f"Alternatively, try using GIF format which works more reliably.")
@@ -435,6 +736,20 @@ class ImageProcessor:
             messagebox.showerror("Error", f"Failed to create animation: {str(e)}")
             return False
     
+    def _gif_palette_samples(self) -> List[np.ndarray]:
+        """Get up to GIF_PALETTE_SAMPLES evenly spaced frames to train the GIF palette on"""
+        step = max(1, len(self.cropped_images) // AppConfig.GIF_PALETTE_SAMPLES)
+        return list(islice(self._iter_rgb_frames(step=step), AppConfig.GIF_PALETTE_SAMPLES))
+    
+    def _iter_rgb_frames(self, size: Optional[Tuple[int, int]] = None, step: int = 1):
+        """Yield every `step`-th cropped image as an (H, W, 3) uint8 array, optionally downscaled"""
+        for img in self.cropped_images[::step]:
+            rgb = img if img.mode == 'RGB' else img.convert('RGB')
+            if size is not None:
+                rgb = rgb.resize(size, Image.BOX)  # Area average, like INTER_AREA
+            # Pillow RGB data is already uint8 in 0-255
+            yield np.asarray(rgb)
+    
     def _get_unique_filename(self, filepath: str) -> str:
         """Generate unique filename to avoid overwriting"""
         if not os.path.exists(filepath):
@@ -467,4 +782,6 @@ class ImageProcessor:
     def reset_all(self) -> None:
         """Reset all processing state"""
         self.cropped_images = []
+        self._crop_box = None
+        self._crop_sources = []
         self.reset_view()
@@ -3,6 +3,7 @@ Region of Interest (ROI) management for the Microscopy Image Analyzer
 """
 
 import tkinter as tk
+import numpy as np
 from typing import Optional, Tuple, Dict, Any, Callable
 from config.settings import AppConfig, UIConfig
 
@@ -34,6 +35,8 @@ class ROIManager:
         
         # Drag data
         self.drag_start = {"x": 0, "y": 0}
+        self._drag_event: Optional[tk.Event] = None
+        self._drag_job: Optional[str] = None
         
         # Create context menu
         self._create_context_menu()
@@ -67,19 +70,36 @@ class ROIManager:
     
     def handle_mouse_drag(self, event: tk.Event) -> bool:
         """Handle mouse drag events. Returns True if event was handled."""
+        if not ((self.is_drawing and self.roi_coords) or self.active_handle or self.is_dragging):
+            return False
+        
+        # Motion events can arrive faster than the canvas redraws; only the
+        # latest position is applied once Tk is idle
+        self._drag_event = event
+        if self._drag_job is None:
+            self._drag_job = self.canvas.after_idle(self._flush_drag)
+        return True
+    
+    def _flush_drag(self) -> None:
+        """Apply the most recent drag position"""
+        event, self._drag_event = self._drag_event, None
+        self._drag_job = None
+        if event is None:
+            return
+        
         if self.is_drawing and self.roi_coords:
             self.update_roi_drawing(event.x, event.y)
-            return True
-        
-        if self.active_handle:
+        elif self.active_handle:
             self._resize_roi(event)
-            return True
-        
-        if self.is_dragging:
+        elif self.is_dragging:
             self._move_roi(event)
-            return True
-        
-        return False
+    
+    def _cancel_drag(self) -> None:
+        """Drop a drag update that has not been applied yet"""
+        if self._drag_job is not None:
+            self.canvas.after_cancel(self._drag_job)
+            self._drag_job = None
+        self._drag_event = None
     
     def update_roi_drawing(self, screen_x: int, screen_y: int) -> None:
         """Update ROI during drawing"""
@@ -142,6 +162,11 @@ class ROIManager:
     
     def handle_mouse_release(self, event: tk.Event) -> bool:
         """Handle mouse release events. Returns True if event was handled."""
+        # Finish with the final pointer position before leaving the drag state
+        if self._drag_job is not None:
+            self.canvas.after_cancel(self._drag_job)
+            self._flush_drag()
+        
         if self.is_drawing:
             self.finish_roi_drawing()
             return True
@@ -168,8 +193,9 @@ class ROIManager:
         dy_screen = event.y - self.drag_start["y"]
         
         # Convert to image coordinates
-        dx_img = dx_screen / self.image_processor.scale_factor
-        dy_img = dy_screen / self.image_processor.scale_factor
+        inv_scale = self.image_processor.inv_scale
+        dx_img = dx_screen * inv_scale
+        dy_img = dy_screen * inv_scale
         
         # Apply resize based on active handle
         if self.active_handle == "nw":
@@ -186,8 +212,9 @@ class ROIManager:
             self.roi_coords["end_y"] += dy_img
         
         self.drag_start = {"x": event.x, "y": event.y}
-        self._draw_roi_rectangle()
-        self._draw_resize_handles()
+        corners = self._screen_corners()
+        self._draw_roi_rectangle(corners)
+        self._draw_resize_handles(corners)
         self._notify_roi_changed()
     
     def _move_roi(self, event: tk.Event) -> None:
@@ -199,8 +226,9 @@ class ROIManager:
         dx_screen = event.x - self.drag_start["x"]
         dy_screen = event.y - self.drag_start["y"]
         
-        dx_img = dx_screen / self.image_processor.scale_factor
-        dy_img = dy_screen / self.image_processor.scale_factor
+        inv_scale = self.image_processor.inv_scale
+        dx_img = dx_screen * inv_scale
+        dy_img = dy_screen * inv_scale
         
         # Move all coordinates
         self.roi_coords["start_x"] += dx_img
@@ -209,21 +237,26 @@ class ROIManager:
         self.roi_coords["end_y"] += dy_img
         
         self.drag_start = {"x": event.x, "y": event.y}
-        self._draw_roi_rectangle()
-        self._draw_resize_handles()
+        corners = self._screen_corners()
+        self._draw_roi_rectangle(corners)
+        self._draw_resize_handles(corners)
     
-    def _draw_roi_rectangle(self) -> None:
+    def _screen_corners(self) -> Tuple[int, int, int, int]:
+        """Get the ROI start and end points in screen coordinates with one transform"""
+        corners = np.array([
+            [self.roi_coords["start_x"], self.roi_coords["start_y"]],
+            [self.roi_coords["end_x"], self.roi_coords["end_y"]]
+        ], dtype=float)
+        (x1, y1), (x2, y2) = self.image_processor.image_to_screen_array(corners).astype(int).tolist()
+        return x1, y1, x2, y2
+    
+    def _draw_roi_rectangle(self, corners: Optional[Tuple[int, int, int, int]] = None) -> None:
         """Draw the ROI rectangle on canvas"""
         if not self.roi_coords:
             return
         
         # Get screen coordinates
-        x1, y1 = self.image_processor.image_to_screen_coords(
-            self.roi_coords["start_x"], self.roi_coords["start_y"]
-        )
-        x2, y2 = self.image_processor.image_to_screen_coords(
-            self.roi_coords["end_x"], self.roi_coords["end_y"]
-        )
+        x1, y1, x2, y2 = corners or self._screen_corners()
         
         # Update or create rectangle
         if self.roi_rect:
@@ -237,20 +270,14 @@ class ROIManager:
                 tags="roi"
             )
     
-    def _draw_resize_handles(self) -> None:
-        """Draw resize handles at ROI corners"""
-        self._clear_resize_handles()
-        
+    def _draw_resize_handles(self, corners: Optional[Tuple[int, int, int, int]] = None) -> None:
+        """Draw resize handles at ROI corners, moving existing handles if present"""
         if not self.roi_coords:
+            self._clear_resize_handles()
             return
         
         # Get corner coordinates
-        x1, y1 = self.image_processor.image_to_screen_coords(
-            self.roi_coords["start_x"], self.roi_coords["start_y"]
-        )
-        x2, y2 = self.image_processor.image_to_screen_coords(
-            self.roi_coords["end_x"], self.roi_coords["end_y"]
-        )
+        x1, y1, x2, y2 = corners or self._screen_corners()
         
         handles = {
             "nw": (x1, y1),
@@ -259,6 +286,15 @@ class ROIManager:
             "se": (x2, y2)
         }
         
+        if self.resize_handles:
+            for handle, (x, y) in zip(self.resize_handles, handles.values()):
+                self.canvas.coords(
+                    handle,
+                    x - self.handle_size, y - self.handle_size,
+                    x + self.handle_size, y + self.handle_size
+                )
+            return
+        
         for tag, (x, y) in handles.items():
             handle = self.canvas.create_rectangle(
                 x - self.handle_size, y - self.handle_size,
@@ -307,6 +343,7 @@ class ROIManager:
     
     def clear_roi(self) -> None:
         """Clear the entire ROI"""
+        self._cancel_drag()
         if self.roi_rect:
             self.canvas.delete(self.roi_rect)
             self.roi_rect = None
@@ -344,9 +381,10 @@ class ROIManager:
     def update_display(self) -> None:
         """Update ROI display after zoom/pan changes"""
         if self.roi_coords:
-            self._draw_roi_rectangle()
+            corners = self._screen_corners()
+            self._draw_roi_rectangle(corners)
             if not self.is_drawing:
-                self._draw_resize_handles()
+                self._draw_resize_handles(corners)
     
     def has_roi(self) -> bool:
         """Check if ROI is defined"""
@@ -5,8 +5,34 @@ Animation Export Dialog for creating GIFs and Videos
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
-from typing import Dict, Any, Optional, Callable
+from functools import partial
+from typing import Dict, Any, Optional, Callable, Set
 from config.settings import AppConfig, UIConfig
+from .styles import ensure_styles
+
+# Frame rate presets offered next to the FPS slider
+_PRESETS = (
+    ("Slow", 2.0),
+    ("Normal", 5.0),
+    ("Fast", 10.0),
+    ("Very Fast", 20.0)
+)
+
+# File extension and display name for each animation format
+_EXTENSIONS = {'gif': '.gif', 'video': '.mp4'}
+_FORMAT_DISPLAY = {'gif': 'GIF', 'video': 'MP4'}
+
+# Settings a freshly shown dialog starts from
+_DEFAULT_SETTINGS = {
+    'format': 'gif',  # 'gif' or 'video'
+    'fps': 5.0,
+    'duration_per_frame': 0.2,
+    'filename': 'animation',
+    'video_codec': 'mp4v',
+    'video_quality': 'high',
+    'loop_count': 0,  # 0 = infinite loop
+    'optimize': True
+}
 
 
 class AnimationExportDialog:
@@ -18,24 +44,30 @@ class AnimationExportDialog:
         self.result: Optional[Dict[str, Any]] = None
         
         # Default settings
-        self.settings = {
-            'format': 'gif',  # 'gif' or 'video'
-            'fps': 5.0,
-            'duration_per_frame': 0.2,
-            'filename': 'animation',
-            'video_codec': 'mp4v',
-            'video_quality': 'high',
-            'loop_count': 0,  # 0 = infinite loop
-            'optimize': True
-        }
+        self.settings = dict(_DEFAULT_SETTINGS)
+        self._preview_job: Optional[str] = None  # Pending debounced preview refresh
+        self._fps_job: Optional[str] = None  # Pending idle update from the FPS slider
+        self._pending_fps: float = self.settings['fps']
+        self._dir_cache: Dict[str, Set[str]] = {}  # File names per folder, listed once
+        # Last suggested file name and the (filename, extension, folder) it was made for
+        self._suggested_key: Optional[tuple] = None
+        self._suggested_name = ""
+        self._last_preview_key: Optional[tuple] = None  # Inputs of the preview on screen
+        
+        # Advanced option variables always exist, whichever options frame is built
+        self.loop_var = tk.IntVar(value=self.settings['loop_count'])
+        self.optimize_var = tk.BooleanVar(value=self.settings['optimize'])
+        self.quality_var = tk.StringVar(value=self.settings['video_quality'])
+        # Set when the dialog is closed; the dialog is hidden rather than destroyed
+        self._done_var = tk.BooleanVar(value=False)
         
+        ensure_styles(self.parent)
         self._create_dialog()
         
     def _create_dialog(self) -> None:
         """Create the dialog window"""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Animation Export Settings")
-        self.dialog.geometry("450x650")  # Increased height to 650
         self.dialog.resizable(True, True)  # Make it resizable
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
@@ -68,8 +100,8 @@ class AnimationExportDialog:
         self.dialog.focus_set()
         
     def _center_dialog(self) -> None:
-        """Center the dialog on parent window"""
-        self.dialog.update_idletasks()
+        """Size and center the dialog with a single geometry call"""
+        # Screen size doesn't depend on pending layout, so no idle flush is needed
         x = (self.dialog.winfo_screenwidth() // 2) - (450 // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (650 // 2)  # Updated for new height
         self.dialog.geometry(f"450x650+{x}+{y}")
@@ -94,8 +126,7 @@ class AnimationExportDialog:
         gif_desc = ttk.Label(
             format_frame, 
             text="• Best for simple animations and web sharing\n• Smaller file size, universal compatibility",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         gif_desc.pack(anchor=tk.W, padx=20, pady=(0, 5))
         
@@ -112,8 +143,7 @@ class AnimationExportDialog:
         video_desc = ttk.Label(
             format_frame, 
             text="• Better quality for complex animations\n• Higher frame rates, professional presentations",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         video_desc.pack(anchor=tk.W, padx=20)
         
@@ -138,7 +168,8 @@ class AnimationExportDialog:
         )
         self.fps_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
         
-        self.fps_label = ttk.Label(fps_frame, text=f"{self.settings['fps']:.1f}")
+        self.fps_text_var = tk.StringVar(value=f"{self.settings['fps']:.1f}")
+        self.fps_label = ttk.Label(fps_frame, textvariable=self.fps_text_var)
         self.fps_label.pack(side=tk.RIGHT, padx=(5, 10))
         
         # Duration per frame (calculated)
@@ -146,7 +177,8 @@ class AnimationExportDialog:
         duration_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(duration_frame, text="Duration per frame:").pack(side=tk.LEFT)
-        self.duration_label = ttk.Label(duration_frame, text=f"{self.settings['duration_per_frame']:.2f}s")
+        self.duration_text_var = tk.StringVar(value=f"{self.settings['duration_per_frame']:.2f}s")
+        self.duration_label = ttk.Label(duration_frame, textvariable=self.duration_text_var)
         self.duration_label.pack(side=tk.RIGHT)
         
         # Preset buttons
@@ -155,19 +187,12 @@ class AnimationExportDialog:
         
         ttk.Label(preset_frame, text="Presets:").pack(side=tk.LEFT)
         
-        presets = [
-            ("Slow", 2.0),
-            ("Normal", 5.0),
-            ("Fast", 10.0),
-            ("Very Fast", 20.0)
-        ]
-        
-        for name, fps in presets:
+        for name, fps in _PRESETS:
             btn = ttk.Button(
                 preset_frame, 
                 text=name, 
                 width=8,
-                command=lambda f=fps: self._set_fps_preset(f)
+                command=partial(self._set_fps_preset, fps)
             )
             btn.pack(side=tk.RIGHT, padx=2)
             
@@ -190,7 +215,8 @@ class AnimationExportDialog:
         ext_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(ext_frame, text="Will be saved as:").pack(side=tk.LEFT)
-        self.extension_label = ttk.Label(ext_frame, text="animation.gif", font=("TkDefaultFont", 9, "bold"))
+        self.extension_var = tk.StringVar(value="animation.gif")
+        self.extension_label = ttk.Label(ext_frame, textvariable=self.extension_var, style="Bold.TLabel")
         self.extension_label.pack(side=tk.RIGHT)
         
     def _create_advanced_section(self, parent: ttk.Frame) -> None:
@@ -198,15 +224,22 @@ class AnimationExportDialog:
         self.advanced_frame = ttk.LabelFrame(parent, text="Advanced Options", padding="10")
         self.advanced_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # GIF-specific options
-        self.gif_options_frame = ttk.Frame(self.advanced_frame)
+        # Each format's widgets are built the first time that format is selected
+        self.gif_options_frame: Optional[ttk.Frame] = None
+        self.video_options_frame: Optional[ttk.Frame] = None
+        
+        # Update visibility based on current format
+        self._update_advanced_options()
+        
+    def _create_gif_options(self) -> ttk.Frame:
+        """Create the GIF-specific advanced options"""
+        frame = ttk.Frame(self.advanced_frame)
         
         # Loop count
-        loop_frame = ttk.Frame(self.gif_options_frame)
+        loop_frame = ttk.Frame(frame)
         loop_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(loop_frame, text="Loop count:").pack(side=tk.LEFT)
-        self.loop_var = tk.IntVar(value=self.settings['loop_count'])
         loop_spinbox = ttk.Spinbox(
             loop_frame, 
             from_=0, 
@@ -217,31 +250,31 @@ class AnimationExportDialog:
         loop_spinbox.pack(side=tk.RIGHT)
         
         loop_desc = ttk.Label(
-            self.gif_options_frame, 
+            frame, 
             text="(0 = infinite loop)",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         loop_desc.pack(anchor=tk.W, pady=(0, 5))
         
         # Optimization
-        self.optimize_var = tk.BooleanVar(value=self.settings['optimize'])
         optimize_check = ttk.Checkbutton(
-            self.gif_options_frame,
+            frame,
             text="Optimize file size",
             variable=self.optimize_var
         )
         optimize_check.pack(anchor=tk.W, pady=2)
         
-        # Video-specific options
-        self.video_options_frame = ttk.Frame(self.advanced_frame)
+        return frame
+        
+    def _create_video_options(self) -> ttk.Frame:
+        """Create the video-specific advanced options"""
+        frame = ttk.Frame(self.advanced_frame)
         
         # Quality
-        quality_frame = ttk.Frame(self.video_options_frame)
+        quality_frame = ttk.Frame(frame)
         quality_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(quality_frame, text="Quality:").pack(side=tk.LEFT)
-        self.quality_var = tk.StringVar(value=self.settings['video_quality'])
         quality_combo = ttk.Combobox(
             quality_frame,
             textvariable=self.quality_var,
@@ -251,23 +284,23 @@ class AnimationExportDialog:
         )
         quality_combo.pack(side=tk.RIGHT)
         
-        # Update visibility based on current format
-        self._update_advanced_options()
+        return frame
         
     def _create_preview_section(self, parent: ttk.Frame) -> None:
         """Create preview information section"""
         preview_frame = ttk.LabelFrame(parent, text="Preview", padding="10")
         preview_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.preview_text = tk.Text(
-            preview_frame, 
-            height=3,  # Reduced from 4 to 3
-            wrap=tk.WORD,
-            font=("TkDefaultFont", 9),
-            state=tk.DISABLED,
-            background="#f0f0f0"
+        # Read-only text, so a label is enough; updating it is a single variable set
+        self.preview_var = tk.StringVar()
+        self.preview_label = ttk.Label(
+            preview_frame,
+            textvariable=self.preview_var,
+            justify=tk.LEFT,
+            wraplength=400,
+            style="Preview.TLabel"
         )
-        self.preview_text.pack(fill=tk.X)
+        self.preview_label.pack(fill=tk.X)
         
         self._update_preview()
         
@@ -315,14 +348,21 @@ class AnimationExportDialog:
         self._update_preview()
         
     def _on_fps_change(self, value: str) -> None:
-        """Handle FPS change"""
-        fps = float(value)
+        """Handle FPS change, applying a burst of slider moves once Tk is idle"""
+        self._pending_fps = float(value)
+        if self._fps_job is None:
+            self._fps_job = self.dialog.after_idle(self._apply_fps_change)
+        
+    def _apply_fps_change(self) -> None:
+        """Apply the latest FPS from the slider"""
+        self._fps_job = None
+        fps = self._pending_fps
         self.settings['fps'] = fps
         self.settings['duration_per_frame'] = 1.0 / fps
         
-        self.fps_label.config(text=f"{fps:.1f}")
-        self.duration_label.config(text=f"{self.settings['duration_per_frame']:.2f}s")
-        self._update_preview()
+        self.fps_text_var.set(f"{fps:.1f}")
+        self.duration_text_var.set(f"{self.settings['duration_per_frame']:.2f}s")
+        self._schedule_preview()
         
     def _set_fps_preset(self, fps: float) -> None:
         """Set FPS to preset value"""
@@ -332,60 +372,106 @@ class AnimationExportDialog:
     def _on_filename_change(self, *args) -> None:
         """Handle filename change"""
         self.settings['filename'] = self.filename_var.get()
-        self._update_preview()
+        self._schedule_preview()
         
     def _update_advanced_options(self) -> None:
-        """Update visibility of advanced options based on format"""
+        """Show the advanced options for the selected format, creating them on first use"""
         if self.settings['format'] == 'gif':
+            if self.gif_options_frame is None:
+                self.gif_options_frame = self._create_gif_options()
             self.gif_options_frame.pack(fill=tk.X)
-            self.video_options_frame.pack_forget()
+            if self.video_options_frame is not None:
+                self.video_options_frame.pack_forget()
         else:
+            if self.video_options_frame is None:
+                self.video_options_frame = self._create_video_options()
             self.video_options_frame.pack(fill=tk.X)
-            self.gif_options_frame.pack_forget()
+            if self.gif_options_frame is not None:
+                self.gif_options_frame.pack_forget()
+            
+    def _schedule_preview(self) -> None:
+        """Refresh the preview once typing or slider dragging pauses"""
+        self._cancel_preview()
+        self._preview_job = self.dialog.after(AppConfig.PREVIEW_DELAY_MS, self._flush_preview)
+        
+    def _flush_preview(self) -> None:
+        """Run a preview refresh requested through _schedule_preview"""
+        self._preview_job = None
+        self._update_preview()
+        
+    def _cancel_preview(self) -> None:
+        """Drop a pending preview refresh"""
+        if self._preview_job is not None:
+            self.dialog.after_cancel(self._preview_job)
+            self._preview_job = None
+            
+    def _cancel_updates(self) -> None:
+        """Drop pending slider and preview updates before the dialog closes"""
+        if self._fps_job is not None:
+            self.dialog.after_cancel(self._fps_job)
+            self._fps_job = None
+        self._cancel_preview()
             
     def _update_preview(self) -> None:
         """Update preview information"""
         format_type = self.settings['format']
         filename = self.settings['filename'] or "animation"
-        extension = ".gif" if format_type == 'gif' else ".mp4"
+        extension = _EXTENSIONS[format_type]
+        
+        # Nothing visible changes unless one of these did
+        key = (format_type, filename, round(self.settings['fps'], 2), self.export_folder)
+        if key == self._last_preview_key:
+            return
+        self._last_preview_key = key
         
         # Update extension label
-        self.extension_label.config(text=f"{filename}{extension}")
+        self.extension_var.set(f"{filename}{extension}")
         
         # Check for existing files and suggest naming
-        full_path = os.path.join(self.export_folder, f"{filename}{extension}")
-        suggested_name = self._get_unique_filename(full_path)
-        
-        # Build preview text
-        preview_text = f"📁 Export Format: {format_type.upper()}\n"
-        preview_text += f"⚡ Frame rate: {self.settings['fps']:.1f} FPS\n"
-        preview_text += f"⏱️ Duration per frame: {self.settings['duration_per_frame']:.2f}s\n"
-        
+        # The suggestion doesn't depend on the frame rate, so slider drags reuse it
+        suggested_key = (filename, extension, self.export_folder)
+        if suggested_key != self._suggested_key:
+            full_path = os.path.join(self.export_folder, f"{filename}{extension}")
+            self._suggested_name = self._get_unique_filename(full_path)
+            self._suggested_key = suggested_key
+        suggested_name = self._suggested_name
+        
+        # Build preview text in one go
         if suggested_name != f"{filename}{extension}":
-            preview_text += f"\n💡 Note: File will be saved as '{suggested_name}' to avoid overwriting existing file."
+            status = f"💡 Note: File will be saved as '{suggested_name}' to avoid overwriting existing file."
         else:
-            preview_text += f"\n✅ Ready to export as '{suggested_name}'"
-        
-        # Update preview text widget
-        self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, preview_text)
-        self.preview_text.config(state=tk.DISABLED)
+            status = f"✅ Ready to export as '{suggested_name}'"
+        self.preview_var.set(
+            f"📁 Export Format: {_FORMAT_DISPLAY[format_type]}\n"
+            f"⚡ Frame rate: {self.settings['fps']:.1f} FPS\n"
+            f"⏱️ Duration per frame: {self.settings['duration_per_frame']:.2f}s\n"
+            f"\n{status}"
+        )
         
     def _get_unique_filename(self, filepath: str) -> str:
         """Generate unique filename to avoid overwriting"""
-        if not os.path.exists(filepath):
-            return os.path.basename(filepath)
-            
         directory = os.path.dirname(filepath)
         basename = os.path.basename(filepath)
+        
+        # One listing per folder replaces a stat for every candidate name.
+        # Names are compared through normcase, as the file system does on Windows
+        existing = self._dir_cache.get(directory)
+        if existing is None:
+            try:
+                existing = {os.path.normcase(entry) for entry in os.listdir(directory)}
+            except OSError:
+                existing = set()
+            self._dir_cache[directory] = existing
+        
+        if os.path.normcase(basename) not in existing:
+            return basename
+            
         name, ext = os.path.splitext(basename)
         
         counter = 1
         while True:
             new_name = f"{name} ({counter}){ext}"
-            new_path = os.path.join(directory, new_name)
-            if not os.path.exists(new_path):
+            if os.path.normcase(new_name) not in existing:
                 return new_name
             counter += 1
             
@@ -396,11 +482,19 @@ class AnimationExportDialog:
             initialdir=self.export_folder
         )
         if folder:
+            self._dir_cache.clear()  # Re-list in case it changed since
+            self._suggested_key = None
+            self._last_preview_key = None
             self.export_folder = folder
             self._update_preview()
             
     def _on_export(self) -> None:
         """Handle export button"""
+        # Take a slider move that is still waiting for the idle update
+        if self._fps_job is not None:
+            self.dialog.after_cancel(self._fps_job)
+            self._apply_fps_change()
+            
         # Validate settings
         if not self.settings['filename'].strip():
             messagebox.showwarning("Invalid Filename", "Please enter a valid filename.")
@@ -409,20 +503,15 @@ class AnimationExportDialog:
         # Update settings from UI
         self.settings['loop_count'] = self.loop_var.get()
         self.settings['optimize'] = self.optimize_var.get()
-        if hasattr(self, 'quality_var'):
-            self.settings['video_quality'] = self.quality_var.get()
+        self.settings['video_quality'] = self.quality_var.get()
             
-        # Generate final filename
-        extension = ".gif" if self.settings['format'] == 'gif' else ".mp4"
+        # Generate final filename from a fresh listing
+        self._dir_cache.clear()
+        extension = _EXTENSIONS[self.settings['format']]
         base_filename = f"{self.settings['filename']}{extension}"
         full_path = os.path.join(self.export_folder, base_filename)
         final_filename = self._get_unique_filename(full_path)
         
-        # Change button text to show progress
-        original_text = self.export_btn.cget("text")
-        self.export_btn.config(text="⏳ Exporting...", state="disabled")
-        self.dialog.update()
-        
         # Prepare result
         self.result = {
             **self.settings,
@@ -430,25 +519,68 @@ class AnimationExportDialog:
             'final_filename': final_filename
         }
         
-        # Small delay to show the progress state
-        self.dialog.after(100, self._finish_export)
+        # The export itself runs after the dialog closes, so close it right away
+        self._finish_export()
         
     def _finish_export(self) -> None:
         """Finish the export process"""
-        self.dialog.destroy()
+        self._close()
         
     def _on_cancel(self) -> None:
         """Handle cancel button"""
         self.result = None
-        self.dialog.destroy()
+        self._close()
+        
+    def _close(self) -> None:
+        """Hide the dialog so the next export can reuse it"""
+        self._cancel_updates()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._done_var.set(True)
+        
+    def reset(self, export_folder: str) -> None:
+        """Restore the default settings and show the hidden dialog again"""
+        self.export_folder = export_folder
+        self.result = None
+        self.settings = dict(_DEFAULT_SETTINGS)
+        self._pending_fps = self.settings['fps']
+        self._dir_cache.clear()
+        self._suggested_key = None
+        self._last_preview_key = None
+        
+        self.format_var.set(self.settings['format'])
+        self.fps_var.set(self.settings['fps'])
+        self.fps_text_var.set(f"{self.settings['fps']:.1f}")
+        self.duration_text_var.set(f"{self.settings['duration_per_frame']:.2f}s")
+        self.filename_var.set(self.settings['filename'])
+        self.loop_var.set(self.settings['loop_count'])
+        self.optimize_var.set(self.settings['optimize'])
+        self.quality_var.set(self.settings['video_quality'])
+        
+        # The filename trace schedules a refresh; the one below already covers it
+        self._on_format_change()
+        self._cancel_preview()
+        
+        self._done_var.set(False)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.focus_set()
         
     def show(self) -> Optional[Dict[str, Any]]:
         """Show dialog and return result"""
-        self.dialog.wait_window()
+        if not self._done_var.get():
+            self.dialog.wait_variable(self._done_var)
         return self.result
 
 
 def show_animation_export_dialog(parent: tk.Widget, export_folder: str) -> Optional[Dict[str, Any]]:
     """Convenience function to show animation export dialog"""
-    dialog = AnimationExportDialog(parent, export_folder)
+    # Built once per parent and hidden between uses, so later calls only
+    # reset its values instead of creating all the widgets again
+    dialog = getattr(parent, '_animation_export_dialog', None)
+    if dialog is not None and dialog.dialog.winfo_exists():
+        dialog.reset(export_folder)
+    else:
+        dialog = AnimationExportDialog(parent, export_folder)
+        parent._animation_export_dialog = dialog
     return dialog.show()
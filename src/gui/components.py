@@ -201,6 +201,7 @@ class ImageCanvas(ttk.LabelFrame):
         self.on_mouse_drag: Optional[Callable[[tk.Event], None]] = None
         self.on_mouse_release: Optional[Callable[[tk.Event], None]] = None
         self.on_mouse_wheel: Optional[Callable[[tk.Event], None]] = None
+        self.on_resize: Optional[Callable[[tk.Event], None]] = None
         
         self._create_widgets()
     
@@ -241,6 +242,7 @@ class ImageCanvas(ttk.LabelFrame):
         self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_release)
         self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Configure>", self._on_configure)
     
     def _on_motion(self, event: tk.Event) -> None:
         """Handle mouse motion"""
@@ -267,6 +269,11 @@ class ImageCanvas(ttk.LabelFrame):
         if self.on_mouse_wheel:
             self.on_mouse_wheel(event)
     
+    def _on_configure(self, event: tk.Event) -> None:
+        """Handle canvas resize"""
+        if self.on_resize:
+            self.on_resize(event)
+    
     def update_coordinates(self, x: int, y: int) -> None:
         """Update coordinate display"""
         if self.coord_label:
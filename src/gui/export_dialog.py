@@ -5,8 +5,34 @@ Comprehensive Export Dialog for Images, GIFs, and Videos
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+from functools import partial
 from typing import Dict, Any, Optional, Callable
 from config.settings import AppConfig, UIConfig
+from .styles import ensure_styles
+
+# Frame rate presets offered next to the FPS slider
+_PRESETS = (
+    ("Slow", 2.0),
+    ("Normal", 5.0),
+    ("Fast", 10.0),
+    ("Very Fast", 20.0)
+)
+
+# File extension and display name for each animation format
+_EXTENSIONS = {'gif': '.gif', 'video': '.mp4'}
+_FORMAT_DISPLAY = {'gif': 'GIF', 'video': 'MP4'}
+
+# Settings a freshly shown dialog starts from, besides the export folder
+_DEFAULT_SETTINGS = {
+    'export_type': 'images',  # 'images', 'gif', or 'video'
+    'filename': 'export',
+    'fps': 5.0,
+    'duration_per_frame': 0.2,
+    'video_codec': 'mp4v',
+    'video_quality': 'high',
+    'loop_count': 0,  # 0 = infinite loop
+    'optimize': True
+}
 
 
 class ExportDialog:
@@ -18,25 +44,25 @@ class ExportDialog:
         self.result: Optional[Dict[str, Any]] = None
         
         # Default settings
-        self.settings = {
-            'export_type': 'images',  # 'images', 'gif', or 'video'
-            'export_folder': self.default_folder,
-            'filename': 'export',
-            'fps': 5.0,
-            'duration_per_frame': 0.2,
-            'video_codec': 'mp4v',
-            'video_quality': 'high',
-            'loop_count': 0,  # 0 = infinite loop
-            'optimize': True
-        }
+        self.settings = {**_DEFAULT_SETTINGS, 'export_folder': self.default_folder}
+        self._preview_job: Optional[str] = None  # Pending debounced preview refresh
+        self._fps_job: Optional[str] = None  # Pending idle update from the FPS slider
+        self._pending_fps: float = self.settings['fps']
+        self._last_preview_key: Optional[tuple] = None  # Inputs of the preview on screen
+        
+        # Advanced option variables always exist, whichever options frame is built
+        self.loop_var = tk.IntVar(value=self.settings['loop_count'])
+        self.optimize_var = tk.BooleanVar(value=self.settings['optimize'])
+        # Set when the dialog is closed; the dialog is hidden rather than destroyed
+        self._done_var = tk.BooleanVar(value=False)
         
+        ensure_styles(self.parent)
         self._create_dialog()
         
     def _create_dialog(self) -> None:
         """Create the dialog window"""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("🚀 Export Options")
-        self.dialog.geometry("800x600")  # Wider for two-column layout
         self.dialog.resizable(True, True)
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
@@ -64,8 +90,8 @@ class ExportDialog:
         self._on_export_type_change()
         
     def _center_dialog(self) -> None:
-        """Center the dialog on parent window"""
-        self.dialog.update_idletasks()
+        """Size and center the dialog with a single geometry call"""
+        # Screen size doesn't depend on pending layout, so no idle flush is needed
         x = (self.dialog.winfo_screenwidth() // 2) - (800 // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (600 // 2)
         self.dialog.geometry(f"800x600+{x}+{y}")
@@ -115,8 +141,7 @@ class ExportDialog:
         images_desc = ttk.Label(
             type_frame, 
             text="• Export individual cropped images as PNG/JPEG files\n• Perfect for manuscripts and publications",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         images_desc.pack(anchor=tk.W, padx=20, pady=(0, 5))
         
@@ -133,8 +158,7 @@ class ExportDialog:
         gif_desc = ttk.Label(
             type_frame, 
             text="• Best for simple animations and web sharing\n• Smaller file size, universal compatibility",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         gif_desc.pack(anchor=tk.W, padx=20, pady=(0, 5))
         
@@ -151,8 +175,7 @@ class ExportDialog:
         video_desc = ttk.Label(
             type_frame, 
             text="• Better quality for complex animations\n• Higher frame rates, professional presentations",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         video_desc.pack(anchor=tk.W, padx=20)
         
@@ -198,7 +221,8 @@ class ExportDialog:
         preview_frame.pack(fill=tk.X, pady=(5, 0))
         
         ttk.Label(preview_frame, text="Will be saved as:").pack(side=tk.LEFT)
-        self.filename_preview_label = ttk.Label(preview_frame, text="", font=("TkDefaultFont", 9, "bold"))
+        self.filename_preview_var = tk.StringVar()
+        self.filename_preview_label = ttk.Label(preview_frame, textvariable=self.filename_preview_var, style="Bold.TLabel")
         self.filename_preview_label.pack(side=tk.RIGHT)
         
     def _create_animation_settings_section(self, parent: ttk.Frame) -> None:
@@ -222,7 +246,8 @@ class ExportDialog:
         )
         self.fps_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
         
-        self.fps_label = ttk.Label(fps_frame, text=f"{self.settings['fps']:.1f}")
+        self.fps_text_var = tk.StringVar(value=f"{self.settings['fps']:.1f}")
+        self.fps_label = ttk.Label(fps_frame, textvariable=self.fps_text_var)
         self.fps_label.pack(side=tk.RIGHT, padx=(5, 10))
         
         # Duration per frame (calculated)
@@ -230,7 +255,8 @@ class ExportDialog:
         duration_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(duration_frame, text="Duration per frame:").pack(side=tk.LEFT)
-        self.duration_label = ttk.Label(duration_frame, text=f"{self.settings['duration_per_frame']:.2f}s")
+        self.duration_text_var = tk.StringVar(value=f"{self.settings['duration_per_frame']:.2f}s")
+        self.duration_label = ttk.Label(duration_frame, textvariable=self.duration_text_var)
         self.duration_label.pack(side=tk.RIGHT)
         
         # Preset buttons
@@ -239,19 +265,12 @@ class ExportDialog:
         
         ttk.Label(preset_frame, text="Presets:").pack(side=tk.LEFT)
         
-        presets = [
-            ("Slow", 2.0),
-            ("Normal", 5.0),
-            ("Fast", 10.0),
-            ("Very Fast", 20.0)
-        ]
-        
-        for name, fps in presets:
+        for name, fps in _PRESETS:
             btn = ttk.Button(
                 preset_frame, 
                 text=name, 
                 width=8,
-                command=lambda f=fps: self._set_fps_preset(f)
+                command=partial(self._set_fps_preset, fps)
             )
             btn.pack(side=tk.RIGHT, padx=2)
             
@@ -259,15 +278,19 @@ class ExportDialog:
         self.advanced_frame = ttk.Frame(self.animation_frame)
         self.advanced_frame.pack(fill=tk.X, pady=(10, 0))
         
-        # GIF-specific options
-        self.gif_options_frame = ttk.Frame(self.advanced_frame)
+        # Each format's widgets are built the first time that format is selected
+        self.gif_options_frame: Optional[ttk.Frame] = None
+        self.video_options_frame: Optional[ttk.Frame] = None
+        
+    def _create_gif_options(self) -> ttk.Frame:
+        """Create the GIF-specific advanced options"""
+        frame = ttk.Frame(self.advanced_frame)
         
         # Loop count
-        loop_frame = ttk.Frame(self.gif_options_frame)
+        loop_frame = ttk.Frame(frame)
         loop_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(loop_frame, text="Loop count:").pack(side=tk.LEFT)
-        self.loop_var = tk.IntVar(value=self.settings['loop_count'])
         loop_spinbox = ttk.Spinbox(
             loop_frame, 
             from_=0, 
@@ -278,48 +301,51 @@ class ExportDialog:
         loop_spinbox.pack(side=tk.RIGHT)
         
         loop_desc = ttk.Label(
-            self.gif_options_frame, 
+            frame, 
             text="(0 = infinite loop)",
-            font=("TkDefaultFont", 8),
-            foreground="gray"
+            style="Desc.TLabel"
         )
         loop_desc.pack(anchor=tk.W, pady=(0, 5))
         
         # Optimization
-        self.optimize_var = tk.BooleanVar(value=self.settings['optimize'])
         optimize_check = ttk.Checkbutton(
-            self.gif_options_frame,
+            frame,
             text="Optimize file size",
             variable=self.optimize_var
         )
         optimize_check.pack(anchor=tk.W, pady=2)
         
-        # Video-specific options
-        self.video_options_frame = ttk.Frame(self.advanced_frame)
+        return frame
+        
+    def _create_video_options(self) -> ttk.Frame:
+        """Create the video-specific advanced options"""
+        frame = ttk.Frame(self.advanced_frame)
         
         # Video info note
         info_label = ttk.Label(
-            self.video_options_frame,
+            frame,
             text="📹 MP4 video will be created with the specified frame rate",
-            font=("TkDefaultFont", 9),
-            foreground="gray"
+            style="Info.TLabel"
         )
         info_label.pack(anchor=tk.W, pady=5)
         
+        return frame
+        
     def _create_preview_section(self, parent: ttk.Frame) -> None:
         """Create preview information section"""
         preview_frame = ttk.LabelFrame(parent, text="👁️ Export Preview", padding="10")
         preview_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.preview_text = tk.Text(
-            preview_frame, 
-            height=4,  # Reduced height for two-column layout
-            wrap=tk.WORD,
-            font=("TkDefaultFont", 9),
-            state=tk.DISABLED,
-            background="#f0f0f0"
+        # Read-only text, so a label is enough; updating it is a single variable set
+        self.preview_var = tk.StringVar()
+        self.preview_label = ttk.Label(
+            preview_frame,
+            textvariable=self.preview_var,
+            justify=tk.LEFT,
+            wraplength=340,
+            style="Preview.TLabel"
         )
-        self.preview_text.pack(fill=tk.X)
+        self.preview_label.pack(fill=tk.X)
         
     def _create_export_buttons(self, parent: ttk.Frame) -> None:
         """Create export dialog buttons"""
@@ -364,26 +390,39 @@ class ExportDialog:
         self._update_preview()
         
     def _update_advanced_options(self) -> None:
-        """Update visibility of advanced options based on format"""
-        if self.settings['export_type'] == 'gif':
-            self.gif_options_frame.pack(fill=tk.X)
-            self.video_options_frame.pack_forget()
-        elif self.settings['export_type'] == 'video':
-            self.video_options_frame.pack(fill=tk.X)
-            self.gif_options_frame.pack_forget()
-        else:
-            self.gif_options_frame.pack_forget()
-            self.video_options_frame.pack_forget()
+        """Show the advanced options for the selected format, creating them on first use"""
+        export_type = self.settings['export_type']
+        if export_type == 'gif' and self.gif_options_frame is None:
+            self.gif_options_frame = self._create_gif_options()
+        elif export_type == 'video' and self.video_options_frame is None:
+            self.video_options_frame = self._create_video_options()
+            
+        # Frames are kept once built, so switching back keeps their values
+        for frame_type, frame in (('gif', self.gif_options_frame),
+                                  ('video', self.video_options_frame)):
+            if frame is None:
+                continue
+            if frame_type == export_type:
+                frame.pack(fill=tk.X)
+            else:
+                frame.pack_forget()
             
     def _on_fps_change(self, value: str) -> None:
-        """Handle FPS change"""
-        fps = float(value)
+        """Handle FPS change, applying a burst of slider moves once Tk is idle"""
+        self._pending_fps = float(value)
+        if self._fps_job is None:
+            self._fps_job = self.dialog.after_idle(self._apply_fps_change)
+        
+    def _apply_fps_change(self) -> None:
+        """Apply the latest FPS from the slider"""
+        self._fps_job = None
+        fps = self._pending_fps
         self.settings['fps'] = fps
         self.settings['duration_per_frame'] = 1.0 / fps
         
-        self.fps_label.config(text=f"{fps:.1f}")
-        self.duration_label.config(text=f"{self.settings['duration_per_frame']:.2f}s")
-        self._update_preview()
+        self.fps_text_var.set(f"{fps:.1f}")
+        self.duration_text_var.set(f"{self.settings['duration_per_frame']:.2f}s")
+        self._schedule_preview()
         
     def _set_fps_preset(self, fps: float) -> None:
         """Set FPS to preset value"""
@@ -393,12 +432,12 @@ class ExportDialog:
     def _on_filename_change(self, *args) -> None:
         """Handle filename change"""
         self.settings['filename'] = self.filename_var.get()
-        self._update_preview()
+        self._schedule_preview()
         
     def _on_folder_change(self, *args) -> None:
         """Handle folder change"""
         self.settings['export_folder'] = self.folder_var.get()
-        self._update_preview()
+        self._schedule_preview()
         
     def _browse_folder(self) -> None:
         """Handle browse folder button"""
@@ -409,39 +448,71 @@ class ExportDialog:
         if folder:
             self.folder_var.set(folder)
             
+    def _schedule_preview(self) -> None:
+        """Refresh the preview once typing or slider dragging pauses"""
+        self._cancel_preview()
+        self._preview_job = self.dialog.after(AppConfig.PREVIEW_DELAY_MS, self._flush_preview)
+        
+    def _flush_preview(self) -> None:
+        """Run a preview refresh requested through _schedule_preview"""
+        self._preview_job = None
+        self._update_preview()
+        
+    def _cancel_preview(self) -> None:
+        """Drop a pending preview refresh"""
+        if self._preview_job is not None:
+            self.dialog.after_cancel(self._preview_job)
+            self._preview_job = None
+            
+    def _cancel_updates(self) -> None:
+        """Drop pending slider and preview updates before the dialog closes"""
+        if self._fps_job is not None:
+            self.dialog.after_cancel(self._fps_job)
+            self._fps_job = None
+        self._cancel_preview()
+            
     def _update_preview(self) -> None:
         """Update preview information"""
         export_type = self.settings['export_type']
         filename = self.settings['filename'] or "export"
         
+        # Nothing visible changes unless one of these did
+        key = (export_type, filename, round(self.settings['fps'], 2), self.settings['export_folder'])
+        if key == self._last_preview_key:
+            return
+        self._last_preview_key = key
+        
         # Update filename preview
         if export_type == 'images':
             preview_name = f"{filename}_001.png, {filename}_002.png, ..."
-        elif export_type == 'gif':
-            preview_name = f"{filename}.gif"
-        else:  # video
-            preview_name = f"{filename}.mp4"
+        else:
+            preview_name = f"{filename}{_EXTENSIONS[export_type]}"
             
-        self.filename_preview_label.config(text=preview_name)
+        self.filename_preview_var.set(preview_name)
         
-        # Build preview text
+        # Build preview text in one go
         if export_type == 'images':
-            preview_text = "📸 Export Type: Individual Images\\n"
-            preview_text += f"📁 Location: {self.settings['export_folder']}\\n"
-            preview_text += "✅ Ready to save cropped images as PNG files"
+            preview_text = (
+                "📸 Export Type: Individual Images\n"
+                f"📁 Location: {self.settings['export_folder']}\n"
+                "✅ Ready to save cropped images as PNG files"
+            )
         else:
-            preview_text = f"🎬 Export Type: {export_type.upper()}\\n"
-            preview_text += f"⚡ Frame rate: {self.settings['fps']:.1f} FPS\\n"
-            preview_text += f"📁 Location: {self.settings['export_folder']}"
+            preview_text = (
+                f"🎬 Export Type: {_FORMAT_DISPLAY[export_type]}\n"
+                f"⚡ Frame rate: {self.settings['fps']:.1f} FPS\n"
+                f"📁 Location: {self.settings['export_folder']}"
+            )
         
-        # Update preview text widget
-        self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, preview_text)
-        self.preview_text.config(state=tk.DISABLED)
+        self.preview_var.set(preview_text)
         
     def _on_export(self) -> None:
         """Handle export button"""
+        # Take a slider move that is still waiting for the idle update
+        if self._fps_job is not None:
+            self.dialog.after_cancel(self._fps_job)
+            self._apply_fps_change()
+            
         # Validate settings
         if not self.settings['filename'].strip():
             messagebox.showwarning("Invalid Filename", "Please enter a valid filename.")
@@ -456,33 +527,69 @@ class ExportDialog:
             self.settings['loop_count'] = self.loop_var.get()
             self.settings['optimize'] = self.optimize_var.get()
                 
-        # Change button text to show progress
-        original_text = self.export_btn.cget("text")
-        self.export_btn.config(text="⏳ Exporting...", state="disabled")
-        self.dialog.update()
-        
         # Prepare result
         self.result = self.settings.copy()
         
-        # Small delay to show the progress state
-        self.dialog.after(100, self._finish_export)
+        # The export itself runs after the dialog closes, so close it right away
+        self._finish_export()
         
     def _finish_export(self) -> None:
         """Finish the export process"""
-        self.dialog.destroy()
+        self._close()
         
     def _on_cancel(self) -> None:
         """Handle cancel button"""
         self.result = None
-        self.dialog.destroy()
+        self._close()
+        
+    def _close(self) -> None:
+        """Hide the dialog so the next export can reuse it"""
+        self._cancel_updates()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._done_var.set(True)
+        
+    def reset(self, default_folder: str = "") -> None:
+        """Restore the default settings and show the hidden dialog again"""
+        self.default_folder = default_folder or os.getcwd()
+        self.result = None
+        self.settings = {**_DEFAULT_SETTINGS, 'export_folder': self.default_folder}
+        self._pending_fps = self.settings['fps']
+        self._last_preview_key = None
+        
+        self.export_type_var.set(self.settings['export_type'])
+        self.folder_var.set(self.settings['export_folder'])
+        self.filename_var.set(self.settings['filename'])
+        self.fps_var.set(self.settings['fps'])
+        self.fps_text_var.set(f"{self.settings['fps']:.1f}")
+        self.duration_text_var.set(f"{self.settings['duration_per_frame']:.2f}s")
+        self.loop_var.set(self.settings['loop_count'])
+        self.optimize_var.set(self.settings['optimize'])
+        
+        # The folder and filename traces schedule a refresh; the one below already covers it
+        self._on_export_type_change()
+        self._cancel_preview()
+        
+        self._done_var.set(False)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.focus_set()
         
     def show(self) -> Optional[Dict[str, Any]]:
         """Show dialog and return result"""
-        self.dialog.wait_window()
+        if not self._done_var.get():
+            self.dialog.wait_variable(self._done_var)
         return self.result
 
 
 def show_export_dialog(parent: tk.Widget, default_folder: str = "") -> Optional[Dict[str, Any]]:
     """Convenience function to show export dialog"""
-    dialog = ExportDialog(parent, default_folder)
+    # Built once per parent and hidden between uses, so later calls only
+    # reset its values instead of creating all the widgets again
+    dialog = getattr(parent, '_export_dialog', None)
+    if dialog is not None and dialog.dialog.winfo_exists():
+        dialog.reset(default_folder)
+    else:
+        dialog = ExportDialog(parent, default_folder)
+        parent._export_dialog = dialog
     return dialog.show()
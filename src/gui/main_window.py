@@ -11,6 +11,7 @@ from .components import (
     PathControls, CellLocationControls, ROIControls, 
     CroppingControls, ImageCanvas, NavigationControls
 )
+from .styles import ensure_styles
 
 
 class MainWindow:
@@ -47,10 +48,7 @@ class MainWindow:
     
     def _configure_styles(self) -> None:
         """Configure custom styles"""
-        self.style.configure('Accent.TButton', foreground='white', background='#d9534f')
-        self.style.configure('Success.TLabel', foreground=UIConfig.SUCCESS_COLOR)
-        self.style.configure('Error.TLabel', foreground=UIConfig.ERROR_COLOR)
-        self.style.configure('Warning.TLabel', foreground=UIConfig.WARNING_COLOR)
+        ensure_styles(self.root)
     
     def _create_menu_bar(self) -> None:
         """Create the menu bar"""
@@ -0,0 +1,29 @@
+"""
+Shared ttk styles for the main window and dialogs
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from config.settings import UIConfig
+
+
+def ensure_styles(root: tk.Misc) -> ttk.Style:
+    """Register the custom styles for root's Tk instance, once"""
+    style = ttk.Style(root)
+    
+    # Styles live in the Tk interpreter, so a configured one means all are
+    if style.lookup('Desc.TLabel', 'font'):
+        return style
+    
+    style.configure('Accent.TButton', foreground='white', background='#d9534f')
+    style.configure('Success.TLabel', foreground=UIConfig.SUCCESS_COLOR)
+    style.configure('Error.TLabel', foreground=UIConfig.ERROR_COLOR)
+    style.configure('Warning.TLabel', foreground=UIConfig.WARNING_COLOR)
+    
+    # Export dialog labels
+    style.configure('Desc.TLabel', font=("TkDefaultFont", 8), foreground="gray")
+    style.configure('Info.TLabel', font=("TkDefaultFont", 9), foreground="gray")
+    style.configure('Bold.TLabel', font=("TkDefaultFont", 9, "bold"))
+    style.configure('Preview.TLabel', font=("TkDefaultFont", 9), background="#f0f0f0")
+    return style
@@ -3,17 +3,21 @@ File handling utilities
 """
 
 import os
-import glob
 from typing import List, Tuple
 from config.settings import AppConfig
 
 
 def get_image_files(folder_path: str) -> List[str]:
     """Get all image files from a folder"""
-    image_paths = []
-    for ext in AppConfig.SUPPORTED_FORMATS:
-        image_paths.extend(glob.glob(os.path.join(folder_path, ext)))
-    return sorted(image_paths)
+    # Hidden files are skipped, as glob would (e.g. macOS '._name.tif').
+    # scandir gets the entry type from the directory listing, so checking
+    # for files (not folders named like images) needs no extra stat call
+    with os.scandir(folder_path) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if not entry.name.startswith('.') and AppConfig.is_supported(entry.name)
+            and entry.is_file()
+        )
 
 
 def ensure_directory(path: str) -> bool:
@@ -37,5 +41,4 @@ def is_valid_image_file(file_path: str) -> bool:
     if not os.path.exists(file_path):
         return False
     
-    _, ext = os.path.splitext(file_path)
-    return any(ext.lower() in pattern.replace('*', '') for pattern in AppConfig.SUPPORTED_FORMATS)
+    return AppConfig.is_supported(os.path.basename(file_path))
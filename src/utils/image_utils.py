@@ -59,5 +59,6 @@ def crop_image_safe(image: Image.Image,
 
 
 def convert_to_rgb_array(image: Image.Image) -> np.ndarray:
-    """Convert PIL image to RGB numpy array"""
-    return np.array(image.convert('RGB'))
+    """Convert PIL image to a read-only RGB numpy array"""
+    # Pillow already exports a fresh buffer; np.array would copy it a second time
+    return np.asarray(image if image.mode == 'RGB' else image.convert('RGB'))
@@ -31,6 +31,13 @@ try:
             self.assertTrue(hasattr(UIConfig, 'BACKGROUND_COLOR'))
             self.assertTrue(hasattr(UIConfig, 'CURSOR_CROSS'))
             self.assertTrue(hasattr(UIConfig, 'FRAME_PADDING'))
+        
+        def test_config_is_read_only(self):
+            """Test that configuration values cannot be reassigned"""
+            with self.assertRaises(AttributeError):
+                AppConfig.MAX_ZOOM = 1.0
+            with self.assertRaises(AttributeError):
+                UIConfig.BACKGROUND_COLOR = 'white'
     
     class TestFileUtils(unittest.TestCase):
         """Test file utility functions"""
@@ -45,6 +52,126 @@ try:
             """Test image file validation"""
             # Note: This tests the logic, not actual file existence
             self.assertFalse(is_valid_image_file("nonexistent.png"))
+        
+        def test_is_supported(self):
+            """Test supported format matching"""
+            self.assertTrue(AppConfig.is_supported("frame_001.tif"))
+            self.assertTrue(AppConfig.is_supported("FRAME_001.JPEG"))
+            self.assertFalse(AppConfig.is_supported("notes.txt"))
+            self.assertFalse(AppConfig.is_supported("frame.tif.bak"))
+
+    class TestImageProcessor(unittest.TestCase):
+        """Test image loading"""
+        
+        def test_decode_cache_is_bounded(self):
+            """Test that decoded images are cached up to the configured size"""
+            import tempfile
+            from PIL import Image
+            from src.core.image_processor import ImageProcessor
+            
+            with tempfile.TemporaryDirectory() as folder:
+                count = AppConfig.IMAGE_CACHE_SIZE + 2
+                for i in range(count):
+                    Image.new('L', (8, 8), i).save(os.path.join(folder, f"frame_{i:03d}.png"))
+                
+                processor = ImageProcessor()
+                self.assertTrue(processor.load_images_from_folder(folder))
+                for i in range(count):
+                    processor.navigate_to_image(i)
+                    self.assertTrue(processor.load_current_image(100, 100))
+                    self.assertEqual(processor.original_image.getpixel((0, 0)), i)
+                processor._executor.shutdown(wait=True)
+                self.assertLessEqual(len(processor._decode_cache), AppConfig.IMAGE_CACHE_SIZE)
+        
+        def _write_frames(self, folder, count, value=0):
+            """Write small PNG frames carrying a text chunk that re-encoding would drop"""
+            from PIL import Image
+            from PIL.PngImagePlugin import PngInfo
+            
+            info = PngInfo()
+            info.add_text("source", folder)
+            for i in range(count):
+                Image.new('L', (8, 6), value + i).save(
+                    os.path.join(folder, f"frame_{i:03d}.png"), pnginfo=info)
+        
+        def test_save_whole_image_crop_copies_source(self):
+            """Test that a crop covering the whole image is exported as a copy of its source"""
+            import tempfile
+            from PIL import Image
+            from src.core.image_processor import ImageProcessor
+            
+            with tempfile.TemporaryDirectory() as folder_a, \
+                    tempfile.TemporaryDirectory() as folder_b, \
+                    tempfile.TemporaryDirectory() as export:
+                self._write_frames(folder_a, 2)
+                self._write_frames(folder_b, 2, value=100)
+                
+                processor = ImageProcessor()
+                processor.load_images_from_folder(folder_a)
+                self.assertTrue(processor.crop_all_images((0, 0, 8, 6)))
+                self.assertTrue(processor.save_cropped_images(export))
+                for i in range(2):
+                    name = f"frame_{i:03d}"
+                    with open(os.path.join(folder_a, f"{name}.png"), 'rb') as source, \
+                            open(os.path.join(export, f"{name}_cropped.png"), 'rb') as saved:
+                        self.assertEqual(source.read(), saved.read())
+                
+                # Crops from folder A are saved from memory, never copied from folder B
+                processor.load_images_from_folder(folder_b)
+                self.assertTrue(processor.save_cropped_images(export))
+                with Image.open(os.path.join(export, "frame_000_cropped.png")) as saved:
+                    self.assertEqual(saved.getpixel((0, 0)), 0)
+                processor._executor.shutdown(wait=True)
+        
+        def test_save_partial_crop(self):
+            """Test that a crop smaller than the image is encoded from the cropped pixels"""
+            import tempfile
+            from PIL import Image
+            from src.core.image_processor import ImageProcessor
+            
+            with tempfile.TemporaryDirectory() as folder, tempfile.TemporaryDirectory() as export:
+                self._write_frames(folder, 2, value=10)
+                
+                processor = ImageProcessor()
+                processor.load_images_from_folder(folder)
+                self.assertTrue(processor.crop_all_images((0, 0, 4, 3)))
+                self.assertTrue(processor.save_cropped_images(export))
+                for i in range(2):
+                    with Image.open(os.path.join(export, f"frame_{i:03d}_cropped.png")) as saved:
+                        self.assertEqual(saved.size, (4, 3))
+                        self.assertEqual(saved.getpixel((0, 0)), 10 + i)
+                        self.assertNotIn("source", saved.info)
+                processor._executor.shutdown(wait=True)
+
+    class TestAnimationExport(unittest.TestCase):
+        """Test animation writing"""
+        
+        def test_write_gif_collapses_repeated_frames(self):
+            """Test that runs of identical frames become one frame with their total duration in ms"""
+            import tempfile
+            import numpy as np
+            from PIL import Image
+            from src.core.image_processor import ImageProcessor
+            
+            red = np.zeros((4, 4, 3), dtype=np.uint8)
+            red[..., 0] = 255
+            blue = np.zeros((4, 4, 3), dtype=np.uint8)
+            blue[..., 2] = 255
+            frames = [red, red.copy(), blue, red]
+            
+            with tempfile.TemporaryDirectory() as folder:
+                path = os.path.join(folder, "out.gif")
+                ImageProcessor._write_gif(path, iter(frames), [red, blue], 0.1)
+                
+                durations = []
+                colors = []
+                with Image.open(path) as gif:
+                    for index in range(gif.n_frames):
+                        gif.seek(index)
+                        durations.append(gif.info['duration'])
+                        colors.append(gif.convert('RGB').getpixel((0, 0)))
+                self.assertEqual(durations, [200, 100, 100])
+                self.assertEqual(colors, [(255, 0, 0), (0, 0, 255), (255, 0, 0)])
 
 except ImportError as e:
     print(f"Import error in tests: {e}")